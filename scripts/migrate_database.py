@@ -221,6 +221,17 @@ class DatabaseMigrator:
                 ]
             ))
         
+        # Migration 3: Index facility patterns by owner and sort order
+        if self.current_version < 3:
+            migrations.append((
+                3,
+                "Add composite index on user_facility_regexes(user_settings_id, sort_order)",
+                [
+                    """CREATE INDEX IF NOT EXISTS idx_user_facility_regexes_settings_sort
+                       ON user_facility_regexes(user_settings_id, sort_order)"""
+                ]
+            ))
+        
         return migrations
     
     def migrate_to_version(self, target_version: int) -> bool:
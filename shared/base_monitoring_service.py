@@ -14,7 +14,10 @@ from typing import Dict, List, Any, Optional
 
 from config.config import load_config
 from shared.notification_manager import NotificationManager
-from shared.utils import load_artcc_roster
+from shared.utils import load_artcc_roster_cached
+
+# Upper bound for the exponential backoff applied after consecutive failed checks
+MAX_ERROR_BACKOFF = 300
 
 
 class BaseMonitoringService(ABC):
@@ -35,7 +38,14 @@ class BaseMonitoringService(ABC):
         self.running = False
         self.monitor_thread = None
         self.check_interval = self.config.get("monitoring", {}).get("check_interval", 60)
-        self.force_check_flag = False
+        # Wakes the monitoring loop early - set by force_check() and stop()
+        self._force_event = threading.Event()
+        self._consecutive_failures = 0
+        
+        # Periodic background roster refresh
+        self.roster_refresh_interval = 60 * 60
+        self._last_roster_refresh = time.monotonic()
+        self._roster_refresh_in_progress = False
         
         # Status tracking for change detection
         self.previous_status = "all_offline"
@@ -44,20 +54,57 @@ class BaseMonitoringService(ABC):
             'supporting_above': [],
             'supporting_below': []
         }
+        self._prev_callsign_sets = {
+            'main': frozenset(),
+            'supporting_above': frozenset(),
+            'supporting_below': frozenset()
+        }
         
         logging.debug(f"{self.__class__.__name__} base initialization complete")
     
+    def _get_roster_url(self):
+        """Get the configured ARTCC roster URL"""
+        return self.config.get("api", {}).get(
+            "roster_url", "https://oakartcc.org/about/roster"
+        )
+    
     def _load_roster(self):
-        """Load ARTCC roster for controller names"""
+        """Load ARTCC roster for controller names (from the on-disk cache when fresh)"""
         try:
-            roster_url = self.config.get("api", {}).get(
-                "roster_url", "https://oakartcc.org/about/roster"
-            )
-            return load_artcc_roster(roster_url)
+            return load_artcc_roster_cached(self._get_roster_url())
         except Exception as e:
             logging.error(f"Error loading roster: {e}")
             return {}
     
+    def _maybe_refresh_roster(self):
+        """Start a background roster refresh if the refresh interval has elapsed"""
+        if self._roster_refresh_in_progress:
+            return
+        if time.monotonic() - self._last_roster_refresh < self.roster_refresh_interval:
+            return
+        
+        self._roster_refresh_in_progress = True
+        self._last_roster_refresh = time.monotonic()
+        threading.Thread(
+            target=self._refresh_roster,
+            name=f"{self.__class__.__name__}:roster",
+            daemon=True
+        ).start()
+    
+    def _refresh_roster(self):
+        """Fetch the roster and swap it in without blocking the monitoring loop"""
+        try:
+            controller_names = load_artcc_roster_cached(self._get_roster_url(), max_age=0)
+            if controller_names:
+                self.controller_names = controller_names
+                if self.notification_manager:
+                    self.notification_manager.update_controller_names(controller_names)
+                logging.info(f"Refreshed ARTCC roster for {self.__class__.__name__}")
+        except Exception as e:
+            logging.error(f"Error refreshing roster: {e}")
+        finally:
+            self._roster_refresh_in_progress = False
+    
     def has_status_changed(self, current_result: Dict[str, Any]) -> bool:
         """
         Check if status has changed (consolidated logic from all monitoring services)
@@ -81,23 +128,19 @@ class BaseMonitoringService(ABC):
             logging.info(f"Status changed from {self.previous_status} to {current_status}")
             return True
         
-        # Check controller lists (using callsign comparison)
-        def get_callsigns(controllers):
-            return sorted([c.get('callsign', '') for c in controllers])
-        
-        current_callsigns = {
-            'main': get_callsigns(current_main),
-            'supporting_above': get_callsigns(current_above),
-            'supporting_below': get_callsigns(current_below)
-        }
-        
-        previous_callsigns = {
-            'main': get_callsigns(self.previous_controllers['main']),
-            'supporting_above': get_callsigns(self.previous_controllers['supporting_above']),
-            'supporting_below': get_callsigns(self.previous_controllers['supporting_below'])
-        }
+        # A different number of controllers in any category is a change - no sets needed
+        previous_controllers = self.previous_controllers
+        if (len(current_main) != len(previous_controllers['main'])
+                or len(current_above) != len(previous_controllers['supporting_above'])
+                or len(current_below) != len(previous_controllers['supporting_below'])):
+            logging.info("Controller lists have changed")
+            return True
         
-        if current_callsigns != previous_callsigns:
+        # Same counts - check controller lists (order-insensitive callsign comparison against the stored sets)
+        previous_sets = self._prev_callsign_sets
+        if (self._callsign_set(current_main) != previous_sets['main']
+                or self._callsign_set(current_above) != previous_sets['supporting_above']
+                or self._callsign_set(current_below) != previous_sets['supporting_below']):
             logging.info("Controller lists have changed")
             return True
         
@@ -117,30 +160,54 @@ class BaseMonitoringService(ABC):
                 'supporting_above': current_result.get('supporting_above', []),
                 'supporting_below': current_result.get('supporting_below', [])
             }
+            self._prev_callsign_sets = {
+                category: self._callsign_set(controllers)
+                for category, controllers in self.previous_controllers.items()
+            }
+    
+    @staticmethod
+    def _callsign_set(controllers) -> frozenset:
+        """
+        Build the set of callsigns for a controller list
+        
+        Args:
+            controllers: List of controller dictionaries
+            
+        Returns:
+            Frozenset of callsigns
+        """
+        return frozenset(c.get('callsign', '') for c in controllers)
     
     def sleep_with_force_check(self, sleep_time=None):
         """
-        Sleep in chunks while checking for force check and stop signals
+        Sleep until the interval elapses, a force check is requested or the service stops
         
         Args:
             sleep_time: Time to sleep (uses check_interval if None)
         """
         sleep_time = sleep_time or self.check_interval
-        sleep_chunk = 0.5  # Sleep in 0.5 second chunks
         
-        while sleep_time > 0 and self.running:
-            if self.force_check_flag:
-                self.force_check_flag = False
+        if self._force_event.wait(sleep_time):
+            self._force_event.clear()
+            if self.running:
                 logging.info("Force check requested, breaking sleep cycle")
-                break
-            
-            chunk_size = min(sleep_chunk, sleep_time)
-            time.sleep(chunk_size)
-            sleep_time -= chunk_size
+    
+    def _next_error_backoff(self) -> float:
+        """
+        Record a failed check and return the delay before the next attempt
+        
+        Returns:
+            Seconds to wait, doubling per consecutive failure up to MAX_ERROR_BACKOFF
+        """
+        backoff = min(MAX_ERROR_BACKOFF, 2 ** self._consecutive_failures)
+        self._consecutive_failures += 1
+        if self._consecutive_failures > 1:
+            logging.warning(f"{self._consecutive_failures} consecutive failed checks, backing off {backoff}s")
+        return backoff
     
     def force_check(self):
-        """Request immediate status check"""
-        self.force_check_flag = True
+        """Request immediate status check (the monitoring loop wakes and runs it)"""
+        self._force_event.set()
         logging.info("Force check requested")
     
     def set_interval(self, interval):
@@ -201,6 +268,8 @@ class BaseMonitoringService(ABC):
                 current_result = self.check_status()
                 
                 if current_result.get('success'):
+                    self._consecutive_failures = 0
+                    
                     # Check if status has changed and handle transitions
                     if self.has_status_changed(current_result):
                         logging.info("Status change detected")
@@ -213,17 +282,22 @@ class BaseMonitoringService(ABC):
                     error_msg = current_result.get('error', 'Unknown error')
                     self.on_error(error_msg)
                 
+                self._maybe_refresh_roster()
+                
                 # Sleep with responsiveness to force checks and shutdown
-                self.sleep_with_force_check()
+                if current_result.get('success'):
+                    self.sleep_with_force_check()
+                else:
+                    # Back off during outages instead of polling at the normal cadence
+                    self.sleep_with_force_check(max(self.check_interval, self._next_error_backoff()))
                 
             except Exception as e:
                 error_msg = f"Unexpected error in monitoring loop: {e}"
                 logging.error(error_msg)
                 self.on_error(error_msg)
                 
-                # Sleep shorter on errors
-                error_sleep_time = min(30, self.check_interval)
-                self.sleep_with_force_check(error_sleep_time)
+                # Never retry sooner than the original fixed error delay
+                self.sleep_with_force_check(max(min(30, self.check_interval), self._next_error_backoff()))
         
         logging.info(f"{self.__class__.__name__} monitoring stopped")
     
@@ -234,6 +308,8 @@ class BaseMonitoringService(ABC):
             return
         
         self.running = True
+        self._consecutive_failures = 0
+        self._force_event.clear()
         
         # Perform initial status check before starting the monitoring loop
         self._perform_initial_check()
@@ -280,6 +356,7 @@ class BaseMonitoringService(ABC):
         
         logging.info(f"Stopping {self.__class__.__name__}...")
         self.running = False
+        self._force_event.set()
         
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5.0)
@@ -140,7 +140,8 @@ class BulkNotificationService:
         status_change: Optional[str] = None,  # Made optional for backward compatibility
         priority: int = 0,
         sound: Optional[str] = None,
-        service_name: str = 'oak_tower_watcher'
+        service_name: str = 'oak_tower_watcher',
+        all_controllers: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Send personalized notifications to users based on their facility configurations and status transitions
@@ -150,6 +151,7 @@ class BulkNotificationService:
             priority: Pushover priority level (-2 to 2)
             sound: Notification sound
             service_name: Service name to filter users by
+            all_controllers: Already-fetched VATSIM controllers; fetched once for the whole pass if None
             
         Returns:
             Dictionary with results summary
@@ -197,6 +199,23 @@ class BulkNotificationService:
         # Load base config
         base_config = load_config()
         
+        # One VATSIM fetch serves every user; each user's patterns only filter the same data
+        if all_controllers is None:
+            try:
+                all_controllers = VATSIMCore(base_config).query_vatsim_api_comprehensive()
+            except Exception as e:
+                logging.error(f"Failed to fetch VATSIM data for personalized bulk notification: {e}")
+                return {
+                    'success': False,
+                    'error': str(e),
+                    'sent_count': 0,
+                    'failed_count': 0,
+                    'details': []
+                }
+        
+        # Transition messages don't depend on the user's config, so one manager serves the whole pass
+        notification_manager = NotificationManager(base_config)
+        
         for user in users:
             try:
                 user_settings_id = user.get('user_id')  # Using user_id as settings identifier
@@ -219,9 +238,6 @@ class BulkNotificationService:
                     vatsim_core = VATSIMCore(user_config)
                     config_type = "default"
                 
-                # Create NotificationManager for transition logic
-                notification_manager = NotificationManager(user_config)
-                
                 # Get cached previous status for this user
                 cached_status = self.db_interface.get_cached_status(user_settings_id)
                 previous_status = cached_status['status'] if cached_status else 'all_offline'
@@ -232,7 +248,7 @@ class BulkNotificationService:
                 previous_supporting_below = cached_status.get('supporting_below', []) if cached_status else []
                 
                 # Check current status with user's configuration
-                status_result = vatsim_core.check_status()
+                status_result = vatsim_core.check_status_from_controllers(all_controllers)
                 
                 if not status_result['success']:
                     logging.warning(f"Failed to get status for user {user['user_email']}: {status_result.get('error', 'Unknown error')}")
@@ -10,9 +10,9 @@ import json
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey, text
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey, func, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, selectinload
 
 Base = declarative_base()
 
@@ -44,7 +44,11 @@ class MinimalUserSettings(Base):
     # Relationship to user
     user = relationship('MinimalUser', back_populates='settings')
     # Relationship to facility patterns
-    facility_regexes = relationship('MinimalUserFacilityRegex', back_populates='user_settings')
+    facility_regexes = relationship(
+        'MinimalUserFacilityRegex',
+        back_populates='user_settings',
+        order_by='MinimalUserFacilityRegex.sort_order'
+    )
     
     def get_all_facility_patterns(self):
         """Get all facility regex patterns organized by type"""
@@ -77,6 +81,7 @@ class MinimalUserFacilityRegex(Base):
     facility_type = Column(String(50), nullable=False)
     regex_pattern = Column(String(255), nullable=False)
     sort_order = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationship to user settings
     user_settings = relationship('MinimalUserSettings', back_populates='facility_regexes')
@@ -137,9 +142,12 @@ class DatabaseInterface:
         try:
             session = self.session_factory()
             
-            # Query for users with valid Pushover settings and notifications enabled
+            # Query for users with valid Pushover settings and notifications enabled; facility patterns
+            # for all matched settings are loaded in one extra IN query instead of one query per user
             results = session.query(MinimalUserSettings, MinimalUser).join(
                 MinimalUser, MinimalUserSettings.user_id == MinimalUser.id
+            ).options(
+                selectinload(MinimalUserSettings.facility_regexes)
             ).filter(
                 MinimalUserSettings.service_name == service_name,
                 MinimalUserSettings.notifications_enabled == True,
@@ -358,36 +366,43 @@ class DatabaseInterface:
         try:
             session = self.session_factory()
             
-            # Query ALL active users with facility patterns (not just those with notifications enabled)
-            # The web monitoring service should monitor all facilities users care about
-            results = session.query(MinimalUserSettings, MinimalUser).join(
+            # Query ALL active users' facility patterns (not just those with notifications enabled) in a single
+            # statement - the web monitoring service should monitor all facilities users care about
+            rows = session.query(
+                MinimalUserFacilityRegex.user_settings_id,
+                MinimalUserFacilityRegex.facility_type,
+                MinimalUserFacilityRegex.regex_pattern
+            ).join(
+                MinimalUserSettings, MinimalUserFacilityRegex.user_settings_id == MinimalUserSettings.id
+            ).join(
                 MinimalUser, MinimalUserSettings.user_id == MinimalUser.id
             ).filter(
                 MinimalUserSettings.service_name == service_name,
                 MinimalUser.is_active == True,
                 MinimalUser.email_verified == True
+            ).order_by(
+                MinimalUserFacilityRegex.user_settings_id,
+                MinimalUserFacilityRegex.sort_order
             ).all()
             
-            # Aggregate all unique patterns
+            session.close()
+            
+            # Aggregate all unique patterns (dict keys give O(1) dedup while keeping first-seen order)
             aggregated_patterns = {
-                'main_facility': set(),
-                'supporting_above': set(),
-                'supporting_below': set()
+                'main_facility': {},
+                'supporting_above': {},
+                'supporting_below': {}
             }
+            user_settings_ids = set()
             
-            for settings, user in results:
-                facility_patterns = settings.get_all_facility_patterns()
-                
-                # Add patterns to respective sets (using sets to avoid duplicates)
-                for pattern_type, patterns in facility_patterns.items():
-                    if pattern_type in aggregated_patterns:
-                        for pattern in patterns:
-                            if pattern.strip():  # Only add non-empty patterns
-                                aggregated_patterns[pattern_type].add(pattern.strip())
-            
-            session.close()
+            for user_settings_id, facility_type, regex_pattern in rows:
+                seen = aggregated_patterns.get(facility_type)
+                pattern = regex_pattern.strip() if regex_pattern else ''
+                if seen is not None and pattern:  # Only add non-empty patterns
+                    seen[pattern] = None
+                    user_settings_ids.add(user_settings_id)
             
-            # Convert sets to lists
+            # Convert ordered key sets to lists
             result = {
                 pattern_type: list(pattern_set)
                 for pattern_type, pattern_set in aggregated_patterns.items()
@@ -406,7 +421,7 @@ class DatabaseInterface:
                     'supporting_below': []
                 })
             
-            logging.info(f"Aggregated {total_patterns} unique facility patterns from {len(results)} users")
+            logging.info(f"Aggregated {total_patterns} unique facility patterns from {len(user_settings_ids)} users")
             return result
             
         except Exception as e:
@@ -420,6 +435,47 @@ class DatabaseInterface:
                 'supporting_below': []
             })
     
+    def get_user_patterns_version(self, service_name: str = 'oak_tower_watcher') -> Optional[tuple]:
+        """
+        Get a cheap signature of the facility patterns get_all_user_facility_patterns() would aggregate
+        
+        Saving patterns deletes and re-inserts rows. SQLite can hand the re-inserted rows the same
+        ids (no AUTOINCREMENT), so the newest created_at is what reliably moves on every save;
+        the row count catches deletions that insert nothing.
+        
+        Args:
+            service_name: The service name to filter by
+            
+        Returns:
+            Tuple of (pattern row count, max pattern row id, newest pattern created_at), or None if unavailable
+        """
+        if not self.enabled or not self.session_factory:
+            return None
+        
+        try:
+            session = self.session_factory()
+            
+            row_count, max_id, max_created_at = session.query(
+                func.count(MinimalUserFacilityRegex.id),
+                func.max(MinimalUserFacilityRegex.id),
+                func.max(MinimalUserFacilityRegex.created_at)
+            ).join(
+                MinimalUserSettings, MinimalUserFacilityRegex.user_settings_id == MinimalUserSettings.id
+            ).join(
+                MinimalUser, MinimalUserSettings.user_id == MinimalUser.id
+            ).filter(
+                MinimalUserSettings.service_name == service_name,
+                MinimalUser.is_active == True,
+                MinimalUser.email_verified == True
+            ).one()
+            
+            session.close()
+            return (row_count, max_id, max_created_at)
+            
+        except Exception as e:
+            logging.error(f"Error getting user facility patterns version: {e}")
+            return None
+    
     def cleanup_old_cache_entries(self, days_old: int = 30) -> int:
         """
         Clean up old cache entries
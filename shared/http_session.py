@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for VATSIM Tower Monitor
+Keeps connections to VATSIM, the ARTCC roster and Pushover alive between requests.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "oak_tower_watcher"
+
+
+def create_session():
+    """
+    Create a requests session with connection pooling and retries on transient upstream errors.
+
+    Only idempotent methods are retried, so Pushover POSTs are never sent twice.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+# Process-wide session shared by all upstream API calls
+SESSION = create_session()
@@ -235,8 +235,12 @@ class NotificationManager:
         
         return success
 
-    def send_bulk_pushover_notification(self, title: str, message: str, status: str):
-        """Send Pushover notifications to all users in database with valid credentials"""
+    def send_bulk_pushover_notification(self, title: str, message: str, status: str, all_controllers=None):
+        """Send Pushover notifications to all users in database with valid credentials
+        
+        Args:
+            all_controllers: Already-fetched VATSIM controllers to evaluate users against (fetched once if None)
+        """
         if not self.bulk_notification_service or not self.bulk_notification_service.enabled:
             logging.debug("Bulk notification service not available - skipping database user notifications")
             return False
@@ -261,7 +265,8 @@ class NotificationManager:
                 status_change=status,
                 priority=priority,
                 sound=sound,
-                service_name='oak_tower_watcher'
+                service_name='oak_tower_watcher',
+                all_controllers=all_controllers
             )
             
             if result['success']:
@@ -280,6 +285,27 @@ class NotificationManager:
             logging.error(f"Error sending bulk Pushover notifications: {e}")
             return False
 
+    def send_bulk_pushover_notification_batch(self, notifications):
+        """Send a batch of queued bulk notifications as a single personalized pass
+        
+        Personalized notifications are built from each user's current status, so every
+        queued entry would produce the same result; the batch collapses to one pass using
+        the most recent entry's priority and sound.
+        
+        Args:
+            notifications: List of (title, message, status) or (title, message, status, all_controllers)
+                           tuples, oldest first
+        """
+        if not notifications:
+            return False
+        
+        if len(notifications) > 1:
+            logging.info(f"Coalescing {len(notifications)} bulk notifications into a single pass")
+        
+        title, message, status, *rest = notifications[-1]
+        all_controllers = rest[0] if rest else None
+        return self.send_bulk_pushover_notification(title, message, status, all_controllers)
+
     def test_pushover(self):
         """Test Pushover notification (both legacy and bulk)"""
         legacy_success = False
@@ -9,6 +9,8 @@ import logging
 import json
 from typing import Optional, Dict, Any, Union
 
+from .http_session import SESSION
+
 
 class PushoverService:
     """Service class for sending Pushover notifications"""
@@ -98,7 +100,7 @@ class PushoverService:
             
         try:
             # Send the request
-            response = requests.post(
+            response = SESSION.post(
                 self.api_url,
                 data=payload,
                 timeout=10
@@ -184,7 +186,7 @@ class PushoverService:
         }
         
         try:
-            response = requests.post(validate_url, data=payload, timeout=10)
+            response = SESSION.post(validate_url, data=payload, timeout=10)
             response_data = response.json()
             
             if response.status_code == 200 and response_data.get("status") == 1:
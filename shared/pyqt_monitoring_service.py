@@ -5,6 +5,7 @@ Provides shared monitoring functionality for PyQt6-based desktop applications.
 """
 
 import logging
+import threading
 from typing import Dict, Any, Optional
 from PyQt6.QtCore import QThread, pyqtSignal
 
@@ -38,7 +39,8 @@ class PyQtMonitoringService(QThread):
         # Threading control
         self.running = False
         self.check_interval = self.config.get("monitoring", {}).get("check_interval", 60)
-        self.force_check_flag = False
+        # Wakes the monitoring loop early - set by force checks and stop()
+        self._force_event = threading.Event()
         
         # Status tracking for change detection
         self.previous_status = "all_offline"
@@ -70,11 +72,11 @@ class PyQtMonitoringService(QThread):
     def _handle_force_check_request(self):
         """Handle force check requests from PyQt signals"""
         self.is_force_check = True
-        self.force_check_flag = True
+        self._force_event.set()
     
     def force_check(self):
         """Request immediate status check"""
-        self.force_check_flag = True
+        self._force_event.set()
         logging.info("Force check requested")
     
     def has_status_changed(self, current_result: Dict[str, Any]) -> bool:
@@ -126,24 +128,17 @@ class PyQtMonitoringService(QThread):
     
     def sleep_with_force_check(self, sleep_time=None):
         """
-        PyQt-compatible sleep with force check responsiveness
-        Uses QThread.msleep instead of time.sleep for proper Qt integration
+        Sleep until the interval elapses, a force check is requested or the service stops
         
         Args:
-            sleep_time: Time to sleep in seconds (converted to ms for Qt)
+            sleep_time: Time to sleep in seconds (uses check_interval if None)
         """
-        sleep_time_ms = int((sleep_time or self.check_interval) * 1000)
-        sleep_chunk_ms = 500  # 500ms chunks
+        sleep_time = sleep_time or self.check_interval
         
-        while sleep_time_ms > 0 and self.running:
-            if self.force_check_flag:
-                self.force_check_flag = False
+        if self._force_event.wait(sleep_time):
+            self._force_event.clear()
+            if self.running:
                 logging.info("Force check requested, breaking sleep cycle")
-                break
-            
-            chunk_size = min(sleep_chunk_ms, sleep_time_ms)
-            self.msleep(chunk_size)
-            sleep_time_ms -= chunk_size
     
     def check_status(self) -> Dict[str, Any]:
         """
@@ -251,6 +246,7 @@ class PyQtMonitoringService(QThread):
             return
         
         self.running = True
+        self._force_event.clear()
         # Start QThread (calls run() method)
         QThread.start(self)
         logging.info(f"{self.__class__.__name__} started successfully")
@@ -264,6 +260,7 @@ class PyQtMonitoringService(QThread):
         
         logging.info(f"Stopping {self.__class__.__name__}...")
         self.running = False
+        self._force_event.set()
         
         # Use QThread methods for proper cleanup
         self.quit()
@@ -6,12 +6,15 @@ Contains helper functions for color manipulation, rating translation, and instan
 
 import os
 import sys
+import json
 import logging
 import re
-import requests
+import tempfile
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 from bs4 import BeautifulSoup, Tag
+from .http_session import SESSION
 
 # fcntl is only available on Unix-like systems
 if sys.platform != "win32":
@@ -20,6 +23,16 @@ if sys.platform != "win32":
 # Global variable to store lock file handle
 _lock_file = None
 
+# On-disk ARTCC roster cache used for fast warm starts
+ROSTER_CACHE_PATH = os.path.join(tempfile.gettempdir(), "vatsim_monitor_artcc_roster.json")
+ROSTER_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Parsed roster cache files keyed by path -> (mtime, contents)
+_roster_memory_cache = {}
+
+# Last formatted response timestamp as [epoch second, ISO string]
+_timestamp_cache = [0, ""]
+
 
 def darken_color_for_notification(rgb_values, factor=0.6):
     """
@@ -148,24 +161,59 @@ def release_instance_lock():
             _lock_file = None
 
 
-def load_artcc_roster(roster_url):
+def response_timestamp():
+    """
+    Get the current UTC time as an ISO 8601 string for API responses.
+
+    The string is formatted at most once per second; concurrent callers may both
+    reformat it at a second boundary, which is harmless.
+
+    Returns:
+        str: Timestamp such as "2024-01-01T12:00:00Z"
+    """
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        cached[:] = [now, datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")]
+    return cached[1]
+
+
+def load_artcc_roster(roster_url, session=None):
     """
     Load ARTCC roster to translate CIDs to real names.
 
     Args:
         roster_url: URL to the ARTCC roster page
+        session: requests session to fetch with (defaults to the shared SESSION)
 
     Returns:
         dict: Dictionary mapping CID to controller name
     """
-    controller_names = {}
-
     try:
         logging.info("Loading ARTCC roster...")
-        response = requests.get(roster_url, timeout=10)
+        response = (session or SESSION).get(roster_url, timeout=10)
         response.raise_for_status()
+        return parse_artcc_roster(response.content)
 
-        soup = BeautifulSoup(response.content, "html.parser")
+    except Exception as e:
+        logging.warning(f"Could not load ARTCC roster: {e}")
+        return {}
+
+
+def parse_artcc_roster(content):
+    """
+    Parse the HTML of an ARTCC roster page.
+
+    Args:
+        content: Raw HTML of the roster page
+
+    Returns:
+        dict: Dictionary mapping CID to controller name
+    """
+    controller_names = {}
+
+    try:
+        soup = BeautifulSoup(content, "html.parser")
 
         # Look for controller information in the roster
         # Try to find tables or structured data containing CID and names
@@ -245,12 +293,125 @@ def load_artcc_roster(roster_url):
             logging.debug(f"Sample entries: {dict(list(controller_names.items())[:3])}")
 
     except Exception as e:
-        logging.warning(f"Could not load ARTCC roster: {e}")
+        logging.warning(f"Could not parse ARTCC roster: {e}")
         controller_names = {}
 
     return controller_names
 
 
+def _read_artcc_roster_cache(roster_url, cache_path):
+    """
+    Read the on-disk roster cache, reusing the parsed copy held in memory while the file is unchanged.
+
+    Returns:
+        dict: Cache entry (controller_names, etag, last_modified) or None if unusable
+    """
+    try:
+        mtime = os.path.getmtime(cache_path)
+        memo = _roster_memory_cache.get(cache_path)
+        if memo and memo[0] == mtime:
+            cached = memo[1]
+        else:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            _roster_memory_cache[cache_path] = (mtime, cached)
+        if cached.get("roster_url") == roster_url and cached.get("controller_names"):
+            return cached
+    except (OSError, ValueError, AttributeError) as e:
+        logging.debug(f"Roster cache not usable ({cache_path}): {e}")
+    return None
+
+
+def load_artcc_roster_cached(roster_url, cache_path=None, max_age=ROSTER_CACHE_MAX_AGE, session=None):
+    """
+    Load ARTCC roster from the on-disk cache if it is fresh, otherwise revalidate it with a conditional GET.
+
+    Args:
+        roster_url: URL to the ARTCC roster page
+        cache_path: Path of the JSON cache file (defaults to ROSTER_CACHE_PATH)
+        max_age: Maximum cache age in seconds before the roster is revalidated (0 always revalidates)
+        session: requests session to fetch with (defaults to the shared SESSION)
+
+    Returns:
+        dict: Dictionary mapping CID to controller name
+    """
+    cache_path = cache_path or ROSTER_CACHE_PATH
+    cached = _read_artcc_roster_cache(roster_url, cache_path)
+
+    if cached:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < max_age:
+                logging.debug(f"Loaded {len(cached['controller_names'])} controller names from roster cache")
+                return cached["controller_names"]
+        except OSError:
+            pass
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        logging.info("Loading ARTCC roster...")
+        response = (session or SESSION).get(roster_url, headers=headers, timeout=10)
+
+        if response.status_code == 304 and cached:
+            # Unchanged upstream - bump the mtime so the cache counts as fresh again
+            os.utime(cache_path, None)
+            logging.info(f"ARTCC roster not modified, using {len(cached['controller_names'])} cached names")
+            return cached["controller_names"]
+
+        response.raise_for_status()
+        controller_names = parse_artcc_roster(response.content)
+        if controller_names:
+            save_artcc_roster_cache(
+                roster_url, controller_names, cache_path,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+            return controller_names
+
+    except Exception as e:
+        logging.warning(f"Could not load ARTCC roster: {e}")
+
+    if cached:
+        logging.info("Using stale roster cache")
+        return cached["controller_names"]
+    return {}
+
+
+def save_artcc_roster_cache(roster_url, controller_names, cache_path=None, etag=None, last_modified=None):
+    """
+    Write the ARTCC roster to the on-disk cache (atomically replaces any existing file).
+
+    Args:
+        roster_url: URL the roster was loaded from
+        controller_names: Dictionary mapping CID to controller name
+        cache_path: Path of the JSON cache file (defaults to ROSTER_CACHE_PATH)
+        etag: ETag response header, used to revalidate the cache
+        last_modified: Last-Modified response header, used to revalidate the cache
+    """
+    cache_path = cache_path or ROSTER_CACHE_PATH
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "roster_url": roster_url,
+                "controller_names": controller_names,
+                "etag": etag,
+                "last_modified": last_modified
+            }, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logging.warning(f"Could not write roster cache: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 def format_controller_name(name):
     """Convert 'lastname, firstname(operatinginitials)' to 'firstname lastname' and extract initials"""
     # Check if the name matches the pattern "lastname, firstname(operatinginitials)"
@@ -9,13 +9,88 @@ import json
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
+
+from .http_session import SESSION
+
+
+@lru_cache(maxsize=512)
+def _compile_callsign_regex(pattern):
+    """Compile a callsign pattern once (case-insensitive); raises re.error if it is not valid regex"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _compile_callsign_pattern(pattern):
+    """Compile a callsign pattern once (case-insensitive); returns None if it is not valid regex"""
+    try:
+        return _compile_callsign_regex(pattern)
+    except re.error:
+        logging.warning(f"Invalid callsign pattern '{pattern}', falling back to exact match")
+        return None
+
+
+@lru_cache(maxsize=512)
+def _compile_callsign_union(patterns):
+    """Fuse a tuple of callsign patterns into one alternation
+    
+    Args:
+        patterns: Tuple of regex pattern strings
+    
+    Returns:
+        Tuple of (compiled alternation or None, frozenset of invalid patterns to match exactly)
+    """
+    valid_patterns = []
+    exact_callsigns = set()
+    for pattern in patterns:
+        if _compile_callsign_pattern(pattern) is not None:
+            valid_patterns.append(pattern)
+        else:
+            exact_callsigns.add(pattern)
+    
+    if not valid_patterns:
+        return None, frozenset(exact_callsigns)
+    if len(valid_patterns) == 1:
+        return _compile_callsign_pattern(valid_patterns[0]), frozenset(exact_callsigns)
+    
+    try:
+        union = re.compile("|".join(f"(?:{pattern})" for pattern in valid_patterns), re.IGNORECASE)
+    except re.error:
+        # Patterns that are valid alone can still clash when fused (e.g. inline global flags)
+        return None, None
+    return union, frozenset(exact_callsigns)
+
+
+@lru_cache(maxsize=512)
+def _fuse_compiled_regexes(regexes):
+    """Fuse a tuple of compiled callsign regexes into a single alternation where possible
+    
+    Args:
+        regexes: Tuple of compiled regex patterns
+    
+    Returns:
+        Tuple with one fused pattern, or the original patterns if they can't be fused
+        (mixed flags, or inline flags that are only valid at the start of a pattern)
+    """
+    if len(regexes) <= 1:
+        return regexes
+    
+    flags = {regex.flags for regex in regexes}
+    if len(flags) == 1:
+        try:
+            return (re.compile("|".join(f"(?:{regex.pattern})" for regex in regexes), flags.pop()),)
+        except re.error:
+            pass
+    return regexes
 
 
 class VATSIMCore:
     """Core VATSIM API client without GUI dependencies"""
 
-    def __init__(self, config):
+    def __init__(self, config, session=None):
         self.config = config
+        # Shared keep-alive session unless the caller brings its own
+        self.session = session or SESSION
 
         # Load API endpoints from config
         api_config = config.get("api", {})
@@ -38,18 +113,49 @@ class VATSIMCore:
         # Compile regex patterns for better performance (case-insensitive matching)
         # This allows capturing multiple controllers matching the same pattern
         # e.g., OAK_TWR, OAK_1_TWR, OAK_2_TWR all match ^OAK_(?:[A-Z\d]+_)?TWR$
+        # Compiled objects are shared between instances, so per-user clients don't recompile
         self.main_facility_regex = [
-            re.compile(pattern, re.IGNORECASE)
+            _compile_callsign_regex(pattern)
             for pattern in self.main_facility_patterns
         ]
         self.supporting_above_regex = [
-            re.compile(pattern, re.IGNORECASE)
+            _compile_callsign_regex(pattern)
             for pattern in self.supporting_above_patterns
         ]
         self.supporting_below_regex = [
-            re.compile(pattern, re.IGNORECASE)
+            _compile_callsign_regex(pattern)
             for pattern in self.supporting_below_patterns
         ]
+        self._update_partition_matchers()
+
+        # Active controller list from the last comprehensive query, reused while the
+        # feed's general.update_timestamp stays the same
+        self._last_update_timestamp = None
+        self._last_active_controllers = []
+
+    @classmethod
+    def from_callsigns(cls, callsigns, api_config=None):
+        """Create a client from just the callsign patterns and API settings (no full config needed)"""
+        return cls({"api": api_config or {}, "callsigns": callsigns})
+
+    def set_compiled_patterns(self, main_facility, supporting_above, supporting_below):
+        """Replace the compiled callsign matchers (e.g. with fused patterns precompiled by the caller)
+        
+        Args:
+            main_facility: List of compiled regex patterns for main facility controllers
+            supporting_above: List of compiled regex patterns for supporting above controllers
+            supporting_below: List of compiled regex patterns for supporting below controllers
+        """
+        self.main_facility_regex = list(main_facility)
+        self.supporting_above_regex = list(supporting_above)
+        self.supporting_below_regex = list(supporting_below)
+        self._update_partition_matchers()
+
+    def _update_partition_matchers(self):
+        """Fuse each facility type's regexes into one alternation for partition_controllers()"""
+        self._main_facility_matchers = _fuse_compiled_regexes(tuple(self.main_facility_regex))
+        self._supporting_above_matchers = _fuse_compiled_regexes(tuple(self.supporting_above_regex))
+        self._supporting_below_matchers = _fuse_compiled_regexes(tuple(self.supporting_below_regex))
 
     def is_controller_active(self, controller):
         """Check if a controller is active (not on inactive frequency 199.998)"""
@@ -61,10 +167,16 @@ class VATSIMCore:
         """Query VATSIM API for ALL controller data (comprehensive collection)"""
         try:
             logging.info("Querying VATSIM API for comprehensive controller data...")
-            response = requests.get(self.vatsim_api_url, timeout=10)
+            response = self.session.get(self.vatsim_api_url, timeout=10)
             response.raise_for_status()
 
             data = response.json()
+            update_timestamp = data.get("general", {}).get("update_timestamp")
+            if update_timestamp and update_timestamp == self._last_update_timestamp:
+                # Same feed revision as last time - hand back the same controller objects
+                logging.debug(f"VATSIM data unchanged since {update_timestamp}, reusing controller list")
+                return list(self._last_active_controllers)
+
             controllers = data.get("controllers", [])
 
             # Filter out inactive controllers but keep ALL active ones
@@ -81,7 +193,9 @@ class VATSIMCore:
                 active_controllers.append(controller)
 
             logging.info(f"Collected {len(active_controllers)} active controllers from VATSIM")
-            return active_controllers
+            self._last_update_timestamp = update_timestamp
+            self._last_active_controllers = active_controllers
+            return list(active_controllers)
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Error querying VATSIM API: {e}")
@@ -94,51 +208,13 @@ class VATSIMCore:
         """Query VATSIM API for controller data (filtered by configured patterns)"""
         try:
             logging.info("Querying VATSIM API...")
-            response = requests.get(self.vatsim_api_url, timeout=10)
+            response = self.session.get(self.vatsim_api_url, timeout=10)
             response.raise_for_status()
 
             data = response.json()
             controllers = data.get("controllers", [])
 
-            # Look for main facility controllers
-            main_facility_controllers = []
-            supporting_above_controllers = []
-            supporting_below_controllers = []
-
-            for controller in controllers:
-                callsign = controller.get("callsign", "")
-
-                # Skip inactive controllers (frequency 199.998)
-                if not self.is_controller_active(controller):
-                    freq = controller.get('frequency', 'Unknown')
-                    logging.debug(f"Skipping inactive controller {callsign} (freq: {freq})")
-                    continue
-
-                # Check for main facility controllers using regex patterns
-                # This captures all controllers matching any main facility pattern
-                # e.g., OAK_TWR, OAK_1_TWR, OAK_2_TWR, etc.
-                if any(regex.match(callsign) for regex in self.main_facility_regex):
-                    main_facility_controllers.append(controller)
-
-                # Check for supporting above facility controllers using regex patterns
-                # e.g., NCT_APP, OAK_36_CTR, OAK_62_CTR, etc.
-                elif any(
-                    regex.match(callsign) for regex in self.supporting_above_regex
-                ):
-                    supporting_above_controllers.append(controller)
-
-                # Check for supporting below controllers using regex patterns
-                # e.g., OAK_GND, OAK_1_GND, OAK_2_GND, etc.
-                elif any(
-                    regex.match(callsign) for regex in self.supporting_below_regex
-                ):
-                    supporting_below_controllers.append(controller)
-
-            return (
-                main_facility_controllers,
-                supporting_above_controllers,
-                supporting_below_controllers,
-            )
+            return self.partition_controllers(controllers)
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Error querying VATSIM API: {e}")
@@ -147,6 +223,54 @@ class VATSIMCore:
             logging.error(f"Error parsing VATSIM API response: {e}")
             raise e
 
+    def partition_controllers(self, controllers):
+        """Split controllers into main, supporting above and supporting below by the configured patterns
+        
+        Args:
+            controllers: Controller records as returned by the VATSIM API (inactive ones are skipped)
+        
+        Returns:
+            Tuple of (main_facility_controllers, supporting_above_controllers, supporting_below_controllers)
+        """
+        # Look for main facility controllers
+        main_facility_controllers = []
+        supporting_above_controllers = []
+        supporting_below_controllers = []
+        main_matchers = self._main_facility_matchers
+        above_matchers = self._supporting_above_matchers
+        below_matchers = self._supporting_below_matchers
+
+        for controller in controllers:
+            callsign = controller.get("callsign", "")
+
+            # Skip inactive controllers (frequency 199.998)
+            if not self.is_controller_active(controller):
+                freq = controller.get('frequency', 'Unknown')
+                logging.debug(f"Skipping inactive controller {callsign} (freq: {freq})")
+                continue
+
+            # Check for main facility controllers using regex patterns
+            # This captures all controllers matching any main facility pattern
+            # e.g., OAK_TWR, OAK_1_TWR, OAK_2_TWR, etc.
+            if any(regex.match(callsign) for regex in main_matchers):
+                main_facility_controllers.append(controller)
+
+            # Check for supporting above facility controllers using regex patterns
+            # e.g., NCT_APP, OAK_36_CTR, OAK_62_CTR, etc.
+            elif any(regex.match(callsign) for regex in above_matchers):
+                supporting_above_controllers.append(controller)
+
+            # Check for supporting below controllers using regex patterns
+            # e.g., OAK_GND, OAK_1_GND, OAK_2_GND, etc.
+            elif any(regex.match(callsign) for regex in below_matchers):
+                supporting_below_controllers.append(controller)
+
+        return (
+            main_facility_controllers,
+            supporting_above_controllers,
+            supporting_below_controllers,
+        )
+
     def determine_status(self, main_facility_controllers, supporting_above_controllers, supporting_below_controllers):
         """Determine the overall status based on controller availability"""
         
@@ -193,21 +317,23 @@ class VATSIMCore:
         if not patterns:
             return []
         
-        filtered_controllers = []
-        compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        union, exact_callsigns = _compile_callsign_union(tuple(patterns))
+        if exact_callsigns is None:
+            # Fall back to matching the patterns one at a time
+            compiled_patterns = [
+                compiled for compiled in map(_compile_callsign_pattern, patterns) if compiled is not None
+            ]
+            return [
+                controller for controller in controllers
+                if controller.get("callsign", "") in patterns
+                or any(pattern.match(controller.get("callsign", "")) for pattern in compiled_patterns)
+            ]
         
+        filtered_controllers = []
         for controller in controllers:
             callsign = controller.get("callsign", "")
-            for pattern in compiled_patterns:
-                try:
-                    if pattern.match(callsign):
-                        filtered_controllers.append(controller)
-                        break  # Don't add the same controller multiple times
-                except re.error:
-                    # If regex fails, try exact match
-                    if pattern.pattern == callsign:
-                        filtered_controllers.append(controller)
-                        break
+            if callsign in exact_callsigns or (union is not None and union.match(callsign)):
+                filtered_controllers.append(controller)
         
         return filtered_controllers
 
@@ -222,18 +348,123 @@ class VATSIMCore:
         Returns:
             Tuple of (main_controllers, supporting_above, supporting_below)
         """
-        main_controllers = self.filter_controllers_by_patterns(
-            all_controllers, facility_patterns.get('main_facility', [])
+        main_union, main_exact = _compile_callsign_union(tuple(facility_patterns.get('main_facility', [])))
+        above_union, above_exact = _compile_callsign_union(tuple(facility_patterns.get('supporting_above', [])))
+        below_union, below_exact = _compile_callsign_union(tuple(facility_patterns.get('supporting_below', [])))
+        
+        if main_exact is None or above_exact is None or below_exact is None:
+            # Some pattern set could not be fused - filter each facility type separately
+            main_controllers = self.filter_controllers_by_patterns(
+                all_controllers, facility_patterns.get('main_facility', [])
+            )
+            supporting_above = self.filter_controllers_by_patterns(
+                all_controllers, facility_patterns.get('supporting_above', [])
+            )
+            supporting_below = self.filter_controllers_by_patterns(
+                all_controllers, facility_patterns.get('supporting_below', [])
+            )
+            return main_controllers, supporting_above, supporting_below
+        
+        main_controllers = []
+        supporting_above = []
+        supporting_below = []
+        
+        # Single pass over the controllers; a controller may still land in more than one bucket
+        for controller in all_controllers:
+            callsign = controller.get("callsign", "")
+            if callsign in main_exact or (main_union is not None and main_union.match(callsign)):
+                main_controllers.append(controller)
+            if callsign in above_exact or (above_union is not None and above_union.match(callsign)):
+                supporting_above.append(controller)
+            if callsign in below_exact or (below_union is not None and below_union.match(callsign)):
+                supporting_below.append(controller)
+        
+        return main_controllers, supporting_above, supporting_below
+
+    def filter_controllers_by_compiled_patterns(self, controllers, compiled_patterns, callsigns=None):
+        """Filter controllers by a list of pre-compiled regex patterns
+        
+        Args:
+            controllers: Sequence of controller records
+            compiled_patterns: List of compiled regex patterns
+            callsigns: Optional sequence of callsigns parallel to controllers
+        """
+        if not compiled_patterns:
+            return []
+        
+        if callsigns is None:
+            callsigns = [controller.get("callsign", "") for controller in controllers]
+        
+        return [
+            controller for callsign, controller in zip(callsigns, controllers)
+            if any(pattern.match(callsign) for pattern in compiled_patterns)
+        ]
+
+    def filter_comprehensive_data_compiled(self, all_controllers, compiled_facility_patterns, callsigns=None):
+        """Filter comprehensive controller data by pre-compiled facility patterns
+        
+        Args:
+            all_controllers: List of all active controllers
+            compiled_facility_patterns: Dict with keys 'main_facility', 'supporting_above', 'supporting_below'
+                                      and values as lists of compiled (case-insensitive) regex patterns
+            callsigns: Optional sequence of callsigns parallel to all_controllers
+        
+        Returns:
+            Tuple of (main_controllers, supporting_above, supporting_below)
+        """
+        if callsigns is None:
+            callsigns = [controller.get("callsign", "") for controller in all_controllers]
+        
+        main_controllers = self.filter_controllers_by_compiled_patterns(
+            all_controllers, compiled_facility_patterns.get('main_facility', []), callsigns
         )
-        supporting_above = self.filter_controllers_by_patterns(
-            all_controllers, facility_patterns.get('supporting_above', [])
+        supporting_above = self.filter_controllers_by_compiled_patterns(
+            all_controllers, compiled_facility_patterns.get('supporting_above', []), callsigns
         )
-        supporting_below = self.filter_controllers_by_patterns(
-            all_controllers, facility_patterns.get('supporting_below', [])
+        supporting_below = self.filter_controllers_by_compiled_patterns(
+            all_controllers, compiled_facility_patterns.get('supporting_below', []), callsigns
         )
         
         return main_controllers, supporting_above, supporting_below
 
+    def filter_comprehensive_data_union(self, all_controllers, main_union, above_union, below_union, callsigns=None,
+                                        exact_callsigns=None):
+        """Filter comprehensive controller data with one fused regex per facility type
+        
+        Args:
+            all_controllers: List of all active controllers
+            main_union: Compiled alternation of all main facility patterns (or None)
+            above_union: Compiled alternation of all supporting above patterns (or None)
+            below_union: Compiled alternation of all supporting below patterns (or None)
+            callsigns: Optional sequence of callsigns parallel to all_controllers
+            exact_callsigns: Optional (main, above, below) sets of upper-case callsigns matched by a
+                             hash lookup instead of a regex
+        
+        Returns:
+            Tuple of (main_controllers, supporting_above, supporting_below)
+        """
+        if callsigns is None:
+            callsigns = [controller.get("callsign", "") for controller in all_controllers]
+        
+        main_exact, above_exact, below_exact = exact_callsigns or (frozenset(), frozenset(), frozenset())
+        check_exact = bool(main_exact or above_exact or below_exact)
+        
+        main_controllers = []
+        supporting_above = []
+        supporting_below = []
+        
+        # A controller may match more than one facility type, same as filter_comprehensive_data
+        for callsign, controller in zip(callsigns, all_controllers):
+            upper_callsign = callsign.upper() if check_exact else None
+            if upper_callsign in main_exact or (main_union is not None and main_union.match(callsign)):
+                main_controllers.append(controller)
+            if upper_callsign in above_exact or (above_union is not None and above_union.match(callsign)):
+                supporting_above.append(controller)
+            if upper_callsign in below_exact or (below_union is not None and below_union.match(callsign)):
+                supporting_below.append(controller)
+        
+        return main_controllers, supporting_above, supporting_below
+
     def check_status_comprehensive(self):
         """Check current status and return comprehensive controller data"""
         try:
@@ -257,6 +488,24 @@ class VATSIMCore:
                 "total_controllers": 0
             }
 
+    def check_status_from_controllers(self, all_controllers):
+        """Build the check_status() result from already-fetched controller data (no API request)
+        
+        Args:
+            all_controllers: Controller records, e.g. from query_vatsim_api_comprehensive()
+        """
+        main_controllers, supporting_above, supporting_below = self.partition_controllers(all_controllers)
+        status = self.determine_status(main_controllers, supporting_above, supporting_below)
+        
+        return {
+            "status": status,
+            "main_controllers": main_controllers,
+            "supporting_above": supporting_above,
+            "supporting_below": supporting_below,
+            "timestamp": datetime.now().isoformat(),
+            "success": True
+        }
+
     def check_status(self):
         """Check current status and return structured data (filtered by configured patterns)"""
         try:
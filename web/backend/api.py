@@ -1,6 +1,6 @@
 from flask import Blueprint, jsonify
 import logging
-from datetime import datetime
+from functools import lru_cache
 from flask_login import login_required, current_user
 import sys
 import os
@@ -10,44 +10,54 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from shared.pushover_service import PushoverService
 from shared.bulk_notification_service import BulkNotificationService
-from shared.utils import format_push_notification
+from shared.utils import format_push_notification, response_timestamp
 # Facility status service moved to facility_monitor module
 from .security import email_verification_required, require_admin_api
-from .web_monitoring_service import web_monitoring_service
+from .web_monitoring_service import get_web_monitoring_service
 
 api_bp = Blueprint('api', __name__)
 
 # Facility status endpoints moved to facility_monitor/api.py
 
+# Static portion of the health response; only the timestamp changes per request
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "service": "OAK Tower Watcher API",
+    "version": "1.0.0"
+}
+
+
+@lru_cache(maxsize=1)
+def _get_public_config() -> dict:
+    """Load the public configuration fields once (config.json is only read at startup)"""
+    # Import config dynamically to avoid import issues
+    from config.config import load_config
+    config = load_config()
+    
+    return {
+        "service_name": "OAK Tower Watcher",
+        "check_interval": config.get("monitoring", {}).get("check_interval", 30)
+    }
+
+
 @api_bp.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "OAK Tower Watcher API",
-        "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0"
-    })
+    return jsonify({**_HEALTH_PAYLOAD, "timestamp": response_timestamp()})
 
 @api_bp.route('/config')
 def get_config():
     """Get basic configuration information"""
     try:
-        # Import config dynamically to avoid import issues
-        from config.config import load_config
-        config = load_config()
-        
-        return jsonify({
-            "service_name": "OAK Tower Watcher",
-            "check_interval": config.get("monitoring", {}).get("check_interval", 30),
-            "timestamp": datetime.now().isoformat()
-        })
+        response = jsonify({**_get_public_config(), "timestamp": response_timestamp()})
+        response.headers['Cache-Control'] = 'public, max-age=60'
+        return response
     except Exception as e:
         logging.error(f"Config API error: {e}")
         return jsonify({
             "error": "Internal server error",
             "status": "error",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 # Facility-specific test endpoints moved to facility_monitor/api.py
@@ -72,7 +82,7 @@ def test_bulk_pushover():
                 "success": False,
                 "error": "Bulk notification service not available",
                 "message": "Database connection or web modules not available for bulk notifications",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Send test notification to all users
@@ -98,7 +108,7 @@ def test_bulk_pushover():
                 "sent_count": sent_count,
                 "failed_count": failed_count,
                 "details": result.get('details', []),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             })
         else:
             logging.error(f"Bulk Pushover test failed: {result.get('error', 'Unknown error')}")
@@ -106,7 +116,7 @@ def test_bulk_pushover():
                 "success": False,
                 "error": result.get("error", "Unknown error"),
                 "message": f"Failed to send bulk test notifications: {result.get('error', 'Unknown error')}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
 
     except Exception as e:
@@ -115,7 +125,7 @@ def test_bulk_pushover():
             "success": False,
             "error": "Internal server error",
             "message": "An unexpected error occurred while testing bulk notifications",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 
@@ -134,7 +144,7 @@ def bulk_notification_stats():
                 "success": False,
                 "error": "Bulk notification service not available",
                 "message": "Database connection or web modules not available",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Get users with valid Pushover settings
@@ -155,7 +165,7 @@ def bulk_notification_stats():
             "message": f"Found {len(users)} users with valid Pushover settings",
             "total_users": len(users),
             "users": user_stats,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         })
 
     except Exception as e:
@@ -164,7 +174,7 @@ def bulk_notification_stats():
             "success": False,
             "error": "Internal server error",
             "message": "An unexpected error occurred while getting stats",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 
@@ -184,7 +194,7 @@ def test_personalized_bulk_notification():
                 "success": False,
                 "error": "Bulk notification service not available",
                 "message": "Database connection or web modules not available for bulk notifications",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Send personalized test notifications to all users
@@ -221,7 +231,7 @@ def test_personalized_bulk_notification():
                 "custom_config_users": custom_config_count,
                 "default_config_users": default_config_count,
                 "details": details,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             })
         else:
             logging.error(f"Personalized bulk notification test failed: {result.get('error', 'Unknown error')}")
@@ -229,7 +239,7 @@ def test_personalized_bulk_notification():
                 "success": False,
                 "error": result.get("error", "Unknown error"),
                 "message": f"Failed to send personalized test notifications: {result.get('error', 'Unknown error')}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
 
     except Exception as e:
@@ -238,7 +248,7 @@ def test_personalized_bulk_notification():
             "success": False,
             "error": "Internal server error",
             "message": "An unexpected error occurred while testing personalized notifications",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 
@@ -251,6 +261,7 @@ def web_monitor_status():
     """Get web monitoring service status"""
     try:
         logging.info(f"Web monitor status requested by user: {current_user.email}")
+        web_monitoring_service = get_web_monitoring_service()
         
         # Get monitoring service status
         is_running = web_monitoring_service.is_running()
@@ -298,7 +309,7 @@ def web_monitor_status():
                 "pattern_counts": pattern_counts,
                 "using_aggregated_config": aggregated_config is not None
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         })
         
     except Exception as e:
@@ -307,7 +318,7 @@ def web_monitor_status():
             "success": False,
             "error": "Internal server error",
             "message": "An unexpected error occurred while getting monitor status",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 
@@ -317,27 +328,28 @@ def web_monitor_force_check():
     """Force immediate comprehensive status check with web monitoring service"""
     try:
         logging.info(f"Web monitor comprehensive force check requested by user: {current_user.email}")
+        web_monitoring_service = get_web_monitoring_service()
         
         if not web_monitoring_service.is_running():
             return jsonify({
                 "success": False,
                 "error": "Monitoring service not running",
                 "message": "Web monitoring service is not currently running",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
-        # Force immediate comprehensive check
+        # Wake the monitoring loop for an immediate comprehensive check
         web_monitoring_service.force_check()
         
-        # Get the result of the check
+        # Report the most recent cached result; the forced check updates it in the background
         cached_data = web_monitoring_service.get_cached_status()
         total_controllers = cached_data.get('total_controllers', 0) if cached_data else 0
         
         return jsonify({
             "success": True,
-            "message": f"Comprehensive force check completed - collected {total_controllers} controllers, notifications sent to users based on their individual patterns",
+            "message": f"Comprehensive force check triggered - last check collected {total_controllers} controllers, a manual check notification will be sent to users based on their individual patterns once it completes",
             "total_controllers": total_controllers,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         })
         
     except Exception as e:
@@ -346,7 +358,7 @@ def web_monitor_force_check():
             "success": False,
             "error": "Internal server error",
             "message": "An unexpected error occurred during force check",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 
@@ -356,6 +368,7 @@ def web_monitor_restart():
     """Restart the web monitoring service"""
     try:
         logging.info(f"Web monitor restart requested by user: {current_user.email}")
+        web_monitoring_service = get_web_monitoring_service()
         
         # Stop if running
         if web_monitoring_service.is_running():
@@ -371,7 +384,7 @@ def web_monitor_restart():
             "success": True,
             "message": "Web monitoring service restarted successfully",
             "running": web_monitoring_service.is_running(),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         })
         
     except Exception as e:
@@ -380,5 +393,5 @@ def web_monitor_restart():
             "success": False,
             "error": "Internal server error",
             "message": "An unexpected error occurred during restart",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
\ No newline at end of file
@@ -7,10 +7,9 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from flask import Flask, jsonify, send_from_directory, render_template, request, abort
-from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
 from flask_login import LoginManager, current_user
 from flask_sqlalchemy import SQLAlchemy
 
@@ -22,19 +21,68 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 from config.config import load_config
 from config.env_config import env_config
 from shared.vatsim_core import VATSIMCore
-from shared.utils import load_artcc_roster, get_controller_name
+from shared.utils import load_artcc_roster, get_controller_name, response_timestamp
 from .models import db, User
 from .auth import auth_bp
 from .admin import admin_bp
 from .email_service import init_mail
 from .api import api_bp
 from .security import init_security, rate_limit
-from .web_monitoring_service import web_monitoring_service
+from .web_monitoring_service import get_web_monitoring_service
 from .training_monitor.api import training_api_bp
-from .training_monitor.service import training_monitoring_service
+from .training_monitor.service import get_training_monitoring_service
 from .training_monitor.models import create_training_tables
 from .facility_monitor.api import facility_api_bp
 from .facility_monitor.models import create_facility_tables
+
+# orjson is optional - jsonify falls back to the standard library encoder without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Static file serving rules (see serve_static)
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates')
+STATIC_MAX_AGE = 300
+STATIC_FORBIDDEN_PATTERNS = (
+    '.env', 'config', 'backup', '.git', '.htaccess', '.htpasswd',
+    'wp-admin', 'wp-login', 'phpmyadmin', 'server-status',
+    'xmlrpc', '.well-known'
+)
+STATIC_ALLOWED_EXTENSIONS = (
+    '.html', '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.ico',
+    '.svg', '.woff', '.woff2', '.ttf', '.eot', '.map'
+)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson, matching Flask's default output"""
+    
+    # Sorted keys like Flask's default; datetimes go through Flask's HTTP-date formatting
+    _OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if ORJSON_AVAILABLE else 0
+    )
+    
+    def dumps(self, obj, **kwargs):
+        # response() passes compact separators, or indent=2 in debug; anything else needs the standard library
+        option = self._OPTIONS
+        if kwargs.get('indent') == 2:
+            option |= orjson.OPT_INDENT_2
+        if set(kwargs) - {'indent', 'separators'} or kwargs.get('indent') not in (None, 2):
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except (orjson.JSONEncodeError, TypeError):
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
  
 def create_app():
     """Application factory with environment-specific configuration"""
@@ -49,6 +97,8 @@ def create_app():
                 template_folder='../templates',
                 static_folder='../',
                 static_url_path='/static')
+    if ORJSON_AVAILABLE:
+        app.json = ORJSONProvider(app)
     
     # Get environment-specific configurations
     flask_config = env_config.get_flask_config()
@@ -59,6 +109,8 @@ def create_app():
     app.config['SECRET_KEY'] = flask_config['SECRET_KEY']
     app.config['DEBUG'] = flask_config['DEBUG']
     app.config['TESTING'] = flask_config['TESTING']
+    # Let browsers reuse static files between page loads instead of re-requesting them
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = STATIC_MAX_AGE
     
     # Apply database configuration
     app.config['SQLALCHEMY_DATABASE_URI'] = db_config['uri']
@@ -67,9 +119,21 @@ def create_app():
     
     # Initialize extensions
     db.init_app(app)
-    CORS(app)
     init_mail(app)
     
+    @app.after_request
+    def add_cors_headers(response):
+        """Allow cross-origin reads of the JSON API (pages and static files don't need CORS)"""
+        if request.path.startswith('/api/'):
+            response.headers['Access-Control-Allow-Origin'] = '*'
+            if request.method == 'OPTIONS':
+                # Preflight: Flask answers OPTIONS automatically, we only add the grants
+                response.headers['Access-Control-Allow-Methods'] = 'GET, HEAD, POST, OPTIONS'
+                requested_headers = request.headers.get('Access-Control-Request-Headers')
+                if requested_headers:
+                    response.headers['Access-Control-Allow-Headers'] = requested_headers
+        return response
+    
     # Initialize Flask-Login
     login_manager = LoginManager()
     login_manager.init_app(app)
@@ -119,10 +183,11 @@ def create_app():
     def start_monitoring_services():
         """Start monitoring services in background"""
         try:
-            web_monitoring_service.start()
+            get_web_monitoring_service().start()
             app.logger.info("Web monitoring service started successfully")
             
             # Also start training monitoring service - set Flask app for context
+            training_monitoring_service = get_training_monitoring_service()
             training_monitoring_service.set_app(app)
             training_monitoring_service.start()
             app.logger.info("Training monitoring service started successfully")
@@ -130,7 +195,7 @@ def create_app():
             app.logger.error(f"Failed to start monitoring services: {e}")
     
     # Start monitoring service after a short delay to ensure app is fully initialized
-    if web_monitoring_service.db_interface.enabled:
+    if get_web_monitoring_service().db_interface.enabled:
         import threading
         threading.Timer(2.0, start_monitoring_services).start()
     else:
@@ -238,33 +303,19 @@ def create_app():
             abort(404)
         
         # Security: Block common attack paths
-        forbidden_patterns = [
-            '.env', 'config', 'backup', '.git', '.htaccess', '.htpasswd',
-            'wp-admin', 'wp-login', 'phpmyadmin', 'server-status',
-            'xmlrpc', '.well-known'
-        ]
-        
         filename_lower = filename.lower()
-        for pattern in forbidden_patterns:
-            if pattern in filename_lower:
-                app.logger.warning(f"Blocked access to forbidden file: {filename} from IP: {request.remote_addr}")
-                abort(403)
+        if any(pattern in filename_lower for pattern in STATIC_FORBIDDEN_PATTERNS):
+            app.logger.warning(f"Blocked access to forbidden file: {filename} from IP: {request.remote_addr}")
+            abort(403)
         
         # Only serve known safe file types
-        allowed_extensions = [
-            '.html', '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.ico',
-            '.svg', '.woff', '.woff2', '.ttf', '.eot', '.map'
-        ]
-        
-        if not any(filename_lower.endswith(ext) for ext in allowed_extensions):
+        if not filename_lower.endswith(STATIC_ALLOWED_EXTENSIONS):
             app.logger.warning(f"Blocked access to disallowed file type: {filename} from IP: {request.remote_addr}")
             abort(404)  # Return 404 instead of revealing file structure
         
         # Check if file exists in templates directory for rendering
-        template_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
-        template_path = os.path.join(template_dir, filename)
-        
-        if filename.endswith('.html') and filename != 'index.html' and os.path.exists(template_path):
+        if (filename.endswith('.html') and filename != 'index.html'
+                and os.path.exists(os.path.join(TEMPLATE_DIR, filename))):
             try:
                 return render_template(filename)
             except Exception as e:
@@ -337,7 +388,7 @@ def access_denied(error):
         return jsonify({
             "error": "Access denied",
             "message": "You do not have permission to access this resource",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 403
     
     # For regular page requests, render the access denied template
@@ -350,7 +401,7 @@ def not_found(error):
     return jsonify({
         "error": "Not found",
         "message": "The requested resource was not found",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": response_timestamp()
     }), 404
 
 @app.errorhandler(500)
@@ -367,7 +418,7 @@ def internal_error(error):
     return jsonify({
         "error": "Internal server error",
         "message": "An unexpected error occurred",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": response_timestamp()
     }), 500
 
 @app.errorhandler(Exception)
@@ -384,7 +435,7 @@ def handle_exception(error):
     return jsonify({
         "error": "Internal server error",
         "message": "An unexpected error occurred",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": response_timestamp()
     }), 500
 
 @app.teardown_appcontext
@@ -396,8 +447,8 @@ def cleanup_web_monitoring(error):
 def cleanup_on_exit():
     """Cleanup function for application shutdown"""
     try:
-        web_monitoring_service.stop()
-        training_monitoring_service.stop()
+        get_web_monitoring_service().stop()
+        get_training_monitoring_service().stop()
         app.logger.info("Monitoring services stopped during shutdown")
     except Exception as e:
         app.logger.error(f"Error stopping web monitoring service: {e}")
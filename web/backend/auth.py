@@ -13,6 +13,7 @@ from .training_monitor.forms import TrainingSessionSettingsForm
 from .training_monitor.models import TrainingSessionSettings, get_available_rating_patterns
 from .email_service import send_verification_email, send_welcome_email, send_password_reset_email
 from .security import email_verification_required
+from .web_monitoring_service import get_web_monitoring_service
 
 # Configure logger for auth module
 logger = logging.getLogger(__name__)
@@ -355,6 +356,7 @@ def oak_tower_settings():
             settings.set_facility_patterns('supporting_below', supporting_below_patterns)
             
             db.session.commit()
+            get_web_monitoring_service().invalidate_aggregated_config()
             logger.info(f"Configuration updated successfully for user: {current_user.email}")
             flash('Your configuration has been updated!')
             return redirect(url_for('auth.dashboard'))
@@ -3,9 +3,9 @@
 Facility Monitor API endpoints
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
+import hashlib
 import logging
-from datetime import datetime
 from flask_login import login_required, current_user
 import sys
 import os
@@ -14,18 +14,44 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
 from shared.pushover_service import PushoverService
-from shared.utils import format_push_notification
-from .service import facility_status_service
+from shared.utils import format_push_notification, response_timestamp
+from .service import get_facility_status_service
 from ..security import email_verification_required
-from ..web_monitoring_service import web_monitoring_service
+from ..web_monitoring_service import get_web_monitoring_service
 
 facility_api_bp = Blueprint('facility_api', __name__)
 
+def _conditional_status_response(cached_data, user_patterns):
+    """Build a status response that revalidates with an ETag
+    
+    The filtered payload only changes when the monitoring service publishes a new
+    snapshot (last_updated) or the user's patterns change, so pollers in between get
+    an empty 304. cache_age_seconds is left out of the tag, so this is only used where
+    clients don't rely on that field being current.
+    
+    Args:
+        cached_data: Filtered status dictionary from the web monitoring service
+        user_patterns: Facility patterns the payload was filtered with
+    """
+    etag = hashlib.sha1(repr((
+        cached_data.get('last_updated'),
+        cached_data.get('user_authenticated'),
+        user_patterns
+    )).encode()).hexdigest()
+    
+    response = jsonify(cached_data)
+    response.set_etag(etag)
+    # Per-user payload: browsers may keep it but must revalidate on every poll
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.vary.add('Cookie')
+    return response.make_conditional(request)
+
 @facility_api_bp.route('/status')
 def get_status():
     """Get current VATSIM monitoring status (using comprehensive cache for instant response)"""
     try:
         user_authenticated = False
+        user_patterns = {}
         cached_data = None
         
         # Check if user is authenticated and get their facility patterns
@@ -39,32 +65,36 @@ def get_status():
                 user_patterns = oak_settings.get_all_facility_patterns()
                 
                 # Get user-filtered status from comprehensive cached data (real-time filtering)
-                cached_data = web_monitoring_service.get_user_filtered_status(user_patterns)
+                cached_data = get_web_monitoring_service().get_user_filtered_status(user_patterns)
             else:
                 # User has no settings, get default view from comprehensive cache
-                cached_data = web_monitoring_service.get_user_filtered_status({})
+                cached_data = get_web_monitoring_service().get_user_filtered_status({})
         else:
             # User not authenticated, get default view from comprehensive cache
-            cached_data = web_monitoring_service.get_user_filtered_status({})
+            cached_data = get_web_monitoring_service().get_user_filtered_status({})
         
         if cached_data is None:
             # No cached data available - service might be starting up, fallback to direct API call
             logging.warning("Comprehensive cache not available, falling back to direct API call")
             user_id = current_user.id if current_user.is_authenticated else None
-            status_data = facility_status_service.get_current_status(user_id=user_id)
-            return jsonify(status_data)
+            status_data = get_facility_status_service().get_current_status(user_id=user_id)
+            
+            # Clients re-polling within the same check interval get a 304 instead of the full body
+            response = jsonify(status_data)
+            response.add_etag()
+            return response.make_conditional(request)
         
         # Add user authentication metadata
         cached_data['user_authenticated'] = user_authenticated
         
-        return jsonify(cached_data)
+        return _conditional_status_response(cached_data, user_patterns)
         
     except Exception as e:
         logging.error(f"Facility API error: {e}")
         return jsonify({
             "error": "Internal server error",
             "status": "error",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 @facility_api_bp.route('/cached-status')
@@ -85,13 +115,13 @@ def get_cached_status():
                 user_patterns = oak_settings.get_all_facility_patterns()
                 
                 # Get user-filtered status from comprehensive cached data (real-time filtering)
-                cached_data = web_monitoring_service.get_user_filtered_status(user_patterns)
+                cached_data = get_web_monitoring_service().get_user_filtered_status(user_patterns)
             else:
                 # User has no settings, get default view from comprehensive cache
-                cached_data = web_monitoring_service.get_user_filtered_status({})
+                cached_data = get_web_monitoring_service().get_user_filtered_status({})
         else:
             # User not authenticated, get default view from comprehensive cache
-            cached_data = web_monitoring_service.get_user_filtered_status({})
+            cached_data = get_web_monitoring_service().get_user_filtered_status({})
         
         if cached_data is None:
             # No cached data available - service might be starting up
@@ -99,12 +129,14 @@ def get_cached_status():
                 "error": "No status data available",
                 "status": "initializing",
                 "message": "Monitoring service is initializing, please try again in a moment",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 503
         
         # Add user authentication metadata
         cached_data['user_authenticated'] = user_authenticated
         
+        # No ETag here: status-page.js reads cache_age_seconds from every poll, and a
+        # 304 would hand it the previous body's (smaller) age
         return jsonify(cached_data)
         
     except Exception as e:
@@ -112,7 +144,7 @@ def get_cached_status():
         return jsonify({
             "error": "Internal server error",
             "status": "error",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 @facility_api_bp.route('/test-pushover', methods=['POST'])
@@ -127,7 +159,7 @@ def test_pushover():
                 "success": False,
                 "error": "Access denied",
                 "message": "You do not have permission to access the VATSIM Facility Watcher",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 403
         
         # Get user's OAK Tower Watcher settings
@@ -137,7 +169,7 @@ def test_pushover():
             return jsonify({
                 "success": False,
                 "error": "User settings not found",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 404
         
         # Check if Pushover is configured
@@ -146,7 +178,7 @@ def test_pushover():
                 "success": False,
                 "error": "Pushover credentials not configured",
                 "message": "Please configure your Pushover API Token and User Key in General Settings first",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Check if notifications are enabled
@@ -155,7 +187,7 @@ def test_pushover():
                 "success": False,
                 "error": "Notifications are disabled",
                 "message": "Please enable notifications in your settings first",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Create Pushover service with user's credentials
@@ -172,7 +204,7 @@ def test_pushover():
             return jsonify({
                 "success": True,
                 "message": "Test notification sent successfully! Check your device.",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             })
         else:
             logging.error(f"Test pushover notification failed for user {current_user.email}: {result['error']}")
@@ -180,7 +212,7 @@ def test_pushover():
                 "success": False,
                 "error": result.get("error", "Unknown error"),
                 "message": f"Failed to send test notification: {result.get('error', 'Unknown error')}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
     
     except Exception as e:
@@ -188,7 +220,7 @@ def test_pushover():
         return jsonify({
             "error": "Internal server error",
             "message": "An unexpected error occurred while sending the test notification",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
 
 @facility_api_bp.route('/test-status-notification', methods=['POST'])
@@ -203,7 +235,7 @@ def test_status_notification():
                 "success": False,
                 "error": "Access denied",
                 "message": "You do not have permission to access the VATSIM Facility Watcher",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 403
         
         logging.info(f"Test status notification requested by user: {current_user.email}")
@@ -216,7 +248,7 @@ def test_status_notification():
                 "success": False,
                 "error": "User settings not found",
                 "message": "Please configure your OAK Tower Watcher settings first",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 404
         
         # Check if Pushover is configured
@@ -225,7 +257,7 @@ def test_status_notification():
                 "success": False,
                 "error": "Pushover credentials not configured",
                 "message": "Please configure your Pushover API Token and User Key in General Settings first",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Check if notifications are enabled
@@ -234,18 +266,18 @@ def test_status_notification():
                 "success": False,
                 "error": "Notifications are disabled",
                 "message": "Please enable notifications in your settings first",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Get current status using user's configuration
-        status_data = facility_status_service.get_current_status(user_id=current_user.id)
+        status_data = get_facility_status_service().get_current_status(user_id=current_user.id)
         
         if status_data.get('error'):
             return jsonify({
                 "success": False,
                 "error": "Failed to get current status",
                 "message": f"Unable to retrieve status information: {status_data.get('error')}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
         
         # Create notification title and message based on current status
@@ -302,7 +334,7 @@ def test_status_notification():
                     "supporting_above": len(supporting_above),
                     "supporting_below": len(supporting_below)
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             })
         else:
             logging.error(f"Test status notification failed for user {current_user.email}: {result['error']}")
@@ -310,7 +342,7 @@ def test_status_notification():
                 "success": False,
                 "error": result.get("error", "Unknown error"),
                 "message": f"Failed to send test status notification: {result.get('error', 'Unknown error')}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": response_timestamp()
             }), 400
     
     except Exception as e:
@@ -319,5 +351,5 @@ def test_status_notification():
             "success": False,
             "error": "Internal server error",
             "message": "An unexpected error occurred while sending the test status notification",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": response_timestamp()
         }), 500
\ No newline at end of file
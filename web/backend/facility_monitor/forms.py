@@ -58,19 +58,24 @@ class FacilityConfigForm(FlaskForm):
         if not field.data:
             return
         
-        patterns = [p.strip() for p in field.data.split('\n') if p.strip()]
+        patterns = self._split_patterns(field.data)
         for i, pattern in enumerate(patterns):
             try:
                 re.compile(pattern, re.IGNORECASE)
             except re.error as e:
                 raise ValidationError(f'{field_name} pattern #{i+1} is invalid: {str(e)}')
     
+    @staticmethod
+    def _split_patterns(data):
+        """Split text area data into stripped, non-empty pattern lines"""
+        return [p for p in map(str.strip, data.splitlines()) if p]
+    
     def get_patterns_list(self, field_name):
         """Convert text area patterns to list"""
         field = getattr(self, field_name)
         if not field.data:
             return []
-        return [p.strip() for p in field.data.split('\n') if p.strip()]
+        return self._split_patterns(field.data)
     
     def set_patterns_from_list(self, field_name, patterns_list):
         """Set text area from patterns list"""
@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 class UserFacilityRegex(db.Model):
     """User-specific facility regex patterns"""
     __tablename__ = 'user_facility_regexes'
+    __table_args__ = (
+        # Patterns are always read per user settings row in sort_order
+        db.Index('idx_user_facility_regexes_settings_sort', 'user_settings_id', 'sort_order'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_settings_id = db.Column(db.Integer, db.ForeignKey('user_settings.id'), nullable=False)
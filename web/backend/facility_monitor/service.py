@@ -7,7 +7,10 @@ import json
 import logging
 import os
 import sys
+import threading
+import time
 from datetime import datetime
+from typing import Optional
 
 # Import shared components using new structure
 import sys
@@ -16,7 +19,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirna
 
 from config.config import load_config
 from shared.vatsim_core import VATSIMCore
-from shared.utils import load_artcc_roster, get_controller_name, get_facility_display_name, extract_facility_name_from_callsign
+from shared.utils import load_artcc_roster_cached, get_controller_name, get_facility_display_name, extract_facility_name_from_callsign
 
 # Import web models for user configuration support
 try:
@@ -34,13 +37,39 @@ class FacilityStatusService:
         roster_url = self.config.get("api", {}).get(
             "roster_url", "https://oakartcc.org/about/roster"
         )
-        self.controller_names = load_artcc_roster(roster_url)
+        self.controller_names = load_artcc_roster_cached(roster_url)
         
         # Create a core VATSIM client instance with default config
         self.vatsim_core = VATSIMCore(self.config)
         
+        # Controllers from the last VATSIM fetch, shared by every request within one check interval
+        self.check_interval = self.config.get("monitoring", {}).get("check_interval", 30)
+        self._controllers_cache = None
+        self._controllers_cache_ts = 0.0
+        self._controllers_cache_iso = None
+        self._controllers_cache_lock = threading.Lock()
+        
         logging.info("Facility Status Service initialized")
     
+    def _get_all_controllers(self):
+        """
+        Get all active VATSIM controllers, fetching at most once per check interval
+        
+        Returns:
+            Tuple of (list of active controller records, ISO timestamp of the fetch)
+        """
+        with self._controllers_cache_lock:
+            if (self._controllers_cache is not None
+                    and time.monotonic() - self._controllers_cache_ts < self.check_interval):
+                return self._controllers_cache, self._controllers_cache_iso
+            
+            # Fetch under the lock so concurrent requests wait for one upstream call instead of each making one
+            all_controllers = self.vatsim_core.query_vatsim_api_comprehensive()
+            self._controllers_cache = all_controllers
+            self._controllers_cache_ts = time.monotonic()
+            self._controllers_cache_iso = datetime.now().isoformat()
+            return all_controllers, self._controllers_cache_iso
+    
     def _get_user_facility_patterns(self, user_id):
         """Get user-specific facility patterns if available"""
         if not WEB_MODELS_AVAILABLE or not user_id:
@@ -98,8 +127,16 @@ class FacilityStatusService:
                     vatsim_core = self._create_user_vatsim_core(user_patterns)
                     logging.debug(f"Using custom facility patterns for user {user_id}")
             
-            # Use the appropriate VATSIM client to check status
-            result = vatsim_core.check_status()
+            # Use the appropriate VATSIM client to check status against the shared controller data
+            try:
+                all_controllers, fetched_at = self._get_all_controllers()
+                result = vatsim_core.check_status_from_controllers(all_controllers)
+                # Report when the data was fetched, so the payload (and its ETag) stays
+                # identical for as long as the cached controllers are served
+                result["timestamp"] = fetched_at
+            except Exception as e:
+                logging.error(f"Error checking status: {e}")
+                result = {"success": False, "error": str(e), "timestamp": datetime.now().isoformat()}
             
             if not result["success"]:
                 return {
@@ -109,22 +146,21 @@ class FacilityStatusService:
                 }
             
             # Format controller data
+            controller_names = self.controller_names
+            
             def format_controllers(controllers):
-                if not controllers:
-                    return []
-                
-                formatted = []
-                for controller in controllers:
-                    formatted.append({
+                return [
+                    {
                         "callsign": controller.get("callsign", "Unknown"),
-                        "name": get_controller_name(controller, self.controller_names),
+                        "name": get_controller_name(controller, controller_names),
                         "frequency": controller.get("frequency", "Unknown"),
                         "cid": controller.get("cid", "Unknown"),
                         "logon_time": controller.get("logon_time", "Unknown"),
                         "server": controller.get("server", "Unknown"),
                         "rating": controller.get("rating", 0)
-                    })
-                return formatted
+                    }
+                    for controller in controllers or ()
+                ]
             
             # Get dynamic facility name based on current status and controllers
             facility_name = get_facility_display_name(
@@ -142,7 +178,7 @@ class FacilityStatusService:
                 "supporting_above": format_controllers(result["supporting_above"]),
                 "supporting_below": format_controllers(result["supporting_below"]),
                 "config": {
-                    "check_interval": self.config.get("monitoring", {}).get("check_interval", 30)
+                    "check_interval": self.check_interval
                 }
             }
             
@@ -163,5 +199,28 @@ class FacilityStatusService:
                 "timestamp": datetime.now().isoformat()
             }
 
-# Create global facility status service instance
-facility_status_service = FacilityStatusService()
\ No newline at end of file
+# Global facility status service instance, created on first use
+_facility_status_service: Optional[FacilityStatusService] = None
+_facility_status_service_lock = threading.Lock()
+
+
+def get_facility_status_service() -> FacilityStatusService:
+    """
+    Get the global facility status service, constructing it on first call
+    
+    Returns:
+        The shared FacilityStatusService instance
+    """
+    global _facility_status_service
+    if _facility_status_service is None:
+        with _facility_status_service_lock:
+            if _facility_status_service is None:
+                _facility_status_service = FacilityStatusService()
+    return _facility_status_service
+
+
+def __getattr__(name):
+    # Backward compatibility for `from .service import facility_status_service`
+    if name == 'facility_status_service':
+        return get_facility_status_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -446,11 +446,26 @@ class UserSettings(db.Model):
     def get_all_facility_patterns(self):
         """Get all facility regex patterns organized by type"""
         try:
-            return {
-                'main_facility': self.get_facility_patterns('main_facility'),
-                'supporting_above': self.get_facility_patterns('supporting_above'),
-                'supporting_below': self.get_facility_patterns('supporting_below')
+            from .facility_monitor.models import UserFacilityRegex
+            patterns = {
+                'main_facility': [],
+                'supporting_above': [],
+                'supporting_below': []
             }
+            
+            # One query for all types instead of one per type
+            rows = db.session.query(
+                UserFacilityRegex.facility_type,
+                UserFacilityRegex.regex_pattern
+            ).filter_by(
+                user_settings_id=self.id
+            ).order_by(UserFacilityRegex.sort_order).all()
+            
+            for facility_type, regex_pattern in rows:
+                if facility_type in patterns:
+                    patterns[facility_type].append(regex_pattern)
+            
+            return patterns
         except Exception as e:
             logger.error(f"Error getting all facility patterns for user settings ID {self.id}: {str(e)}", exc_info=True)
             return {
@@ -471,15 +486,19 @@ class UserSettings(db.Model):
                 facility_type=facility_type
             ).delete()
             
-            # Add new patterns
-            for i, pattern in enumerate(patterns):
-                if pattern.strip():  # Only add non-empty patterns
-                    regex = UserFacilityRegex()
-                    regex.user_settings_id = self.id
-                    regex.facility_type = facility_type
-                    regex.regex_pattern = pattern.strip()
-                    regex.sort_order = i
-                    db.session.add(regex)
+            # Add new patterns (non-empty only) in a single executemany INSERT
+            rows = [
+                {
+                    'user_settings_id': self.id,
+                    'facility_type': facility_type,
+                    'regex_pattern': pattern.strip(),
+                    'sort_order': i
+                }
+                for i, pattern in enumerate(patterns)
+                if pattern.strip()
+            ]
+            if rows:
+                db.session.execute(UserFacilityRegex.__table__.insert(), rows)
             
             db.session.commit()
             logger.debug(f"Successfully set {len(patterns)} facility patterns for user settings ID {self.id}, type {facility_type}")
@@ -14,7 +14,7 @@ from .models import (
     TrainingSessionSettings, TrainingMonitoredRating, TrainingSessionCache,
     GlobalTrainingSessionCache, TrainingSessionNotificationLog, get_available_rating_patterns
 )
-from .service import training_monitoring_service
+from .service import get_training_monitoring_service
 from .scraper import TrainingSessionScraper
 from ..models import db
 
@@ -42,9 +42,13 @@ def get_training_status():
             ).first()
         
         # Get service status from monitoring service
+        training_monitoring_service = get_training_monitoring_service()
         service_status = training_monitoring_service.get_cached_status()
         
-        if not service_status:
+        if service_status is not None:
+            # Materialize the read-only cache view for serialization
+            service_status = dict(service_status)
+        else:
             # Service hasn't run yet
             service_status = {
                 'training_monitoring': {
@@ -247,7 +251,7 @@ def update_training_settings():
                 
                 # Trigger re-filtering from global cache since ratings changed
                 try:
-                    training_monitoring_service.process_user_from_global_cache(settings)
+                    get_training_monitoring_service().process_user_from_global_cache(settings)
                     logger.debug(f"Re-filtered training sessions for user {current_user.email} after rating change")
                 except Exception as refilter_error:
                     logger.warning(f"Could not re-filter sessions after rating change for user {current_user.email}: {refilter_error}")
@@ -456,7 +460,7 @@ def refresh_sessions():
             }), 400
         
         # Process user by filtering from global cache (more efficient)
-        result = training_monitoring_service.process_user_from_global_cache(settings)
+        result = get_training_monitoring_service().process_user_from_global_cache(settings)
         
         if result['success']:
             return jsonify({
@@ -7,8 +7,11 @@ import logging
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 import hashlib
+from collections import ChainMap
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Import shared components  
 import sys
@@ -27,6 +30,14 @@ from ..models import db, User
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Session key expiration notification template
+_EXPIRED_TITLE = "⚠️ OAK ARTCC Session Key Expired"
+_EXPIRED_MSG_TEMPLATE = (
+    "Your OAK ARTCC training session monitoring has stopped working.\n\n"
+    "Error: {error}\n\n"
+    "Please update your PHP session key in the training monitor settings."
+)
+
 class TrainingMonitoringService(BaseMonitoringService):
     """
     Training session monitoring service for OAK ARTCC
@@ -41,19 +52,36 @@ class TrainingMonitoringService(BaseMonitoringService):
         
         # Training-specific components
         self.scraper = TrainingSessionScraper()
-        self._cached_status = None
-        self._cache_lock = threading.Lock()
+        # Published as a single (payload, last_updated_iso, last_update_monotonic) tuple
+        # so readers never observe a payload paired with another update's timestamps.
+        # Single writer (initial check, then the monitor thread), many readers - no lock needed.
+        self._cached_snapshot = None
         self.last_cache_update = None
         
+        # Pushover sends for session key expiry run off the monitor loop's DB session;
+        # shut down in stop() and recreated by start()
+        self._pushover_executor: Optional[ThreadPoolExecutor] = self._create_pushover_executor()
+        
+        # Set while a forced check is pending or running so repeated requests collapse into it
+        self._force_check_in_flight = threading.Event()
+        
         logger.info("Training monitoring service initialized")
     
+    @staticmethod
+    def _create_pushover_executor() -> ThreadPoolExecutor:
+        """Create the thread pool used for session key expiry Pushover sends"""
+        return ThreadPoolExecutor(max_workers=4, thread_name_prefix='training-pushover')
+    
     def set_app(self, app):
         """Set Flask app instance for context"""
         self.app = app
     
     def check_status(self) -> Dict[str, Any]:
         """Check training session status (implements abstract method)"""
-        return self.check_all_users_training_sessions()
+        try:
+            return self.check_all_users_training_sessions()
+        finally:
+            self._force_check_in_flight.clear()
     
     def on_status_changed(self, current_result: Dict[str, Any]):
         """Handle status changes by sending notifications (implements abstract method)"""
@@ -595,7 +623,7 @@ class TrainingMonitoringService(BaseMonitoringService):
                 return False
             
             # Get user for pushover credentials
-            user = User.query.get(user_settings.user_id)
+            user = db.session.get(User, user_settings.user_id)
             if not user:
                 logger.error(f"User {user_settings.user_id} not found")
                 return False
@@ -669,11 +697,11 @@ class TrainingMonitoringService(BaseMonitoringService):
             ).first()
             
             if recent_notification:
-                logger.debug(f"Session key expiration notification already sent recently for user {user_settings.user_id}")
+                logger.debug("Session key expiration notification already sent recently for user %s", user_settings.user_id)
                 return
             
             # Get user for pushover credentials
-            user = User.query.get(user_settings.user_id)
+            user = db.session.get(User, user_settings.user_id)
             if not user:
                 return
             
@@ -682,36 +710,70 @@ class TrainingMonitoringService(BaseMonitoringService):
                 return
             
             # Send notification
-            title = "⚠️ OAK ARTCC Session Key Expired"
-            message = f"Your OAK ARTCC training session monitoring has stopped working.\n\nError: {error_message}\n\nPlease update your PHP session key in the training monitor settings."
+            title = _EXPIRED_TITLE
+            message = _EXPIRED_MSG_TEMPLATE.format(error=error_message)
             
             pushover_service = PushoverService(
                 api_token=user.pushover_api_token,
                 user_key=user.pushover_user_key
             )
             
-            result = pushover_service.send_notification(
+            # Dispatch the HTTP call to the executor; the log row is written once it succeeds
+            settings_id = user_settings.id
+            user_id = user_settings.user_id
+            executor = self._pushover_executor
+            if executor is None:
+                logger.warning("Training monitoring service stopped - skipping session key expiration notification")
+                return
+            future = executor.submit(
+                pushover_service.send_notification,
                 message=message,
                 title=title,
                 priority=1,  # High priority for expired session
                 sound='siren'
             )
-            
-            if result['success']:
-                # Log the notification
-                notification_log = TrainingSessionNotificationLog()
-                notification_log.settings_id = user_settings.id
-                notification_log.session_hash = 'session_key_expired'
-                notification_log.notification_type = 'session_key_expired'
-                
-                db.session.add(notification_log)
-                db.session.commit()
-                
-                logger.info(f"Sent session key expiration notification to user {user_settings.user_id}")
+            future.add_done_callback(
+                lambda f: self._record_session_key_expired_notification(f, settings_id, user_id)
+            )
                 
         except Exception as e:
             logger.error(f"Error sending session key expiration notification: {e}", exc_info=True)
     
+    def _record_session_key_expired_notification(self, future: Future, settings_id: int, user_id: int):
+        """
+        Log a session key expiration notification once its Pushover send completes
+        
+        Args:
+            future: Completed future holding the Pushover send result
+            settings_id: Training session settings ID the notification was sent for
+            user_id: User ID the notification was sent to
+        """
+        try:
+            result = future.result()
+            if not result['success']:
+                logger.error(f"Failed to send session key expiration notification to user {user_id}: {result.get('error')}")
+                return
+            
+            with self.app.app_context():
+                try:
+                    # Log the notification
+                    notification_log = TrainingSessionNotificationLog(
+                        settings_id=settings_id,
+                        session_hash='session_key_expired',
+                        notification_type='session_key_expired'
+                    )
+                    
+                    db.session.add(notification_log)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+            
+            logger.info(f"Sent session key expiration notification to user {user_id}")
+            
+        except Exception as e:
+            logger.error(f"Error recording session key expiration notification: {e}", exc_info=True)
+    
     def _format_name(self, name: str) -> str:
         """
         Format names from "Last, First Rating" or "Last, First" to "First Last" format
@@ -775,46 +837,54 @@ class TrainingMonitoringService(BaseMonitoringService):
     def update_cached_status(self, status_result: Dict[str, Any]):
         """Update cached status data for UI consumption"""
         try:
-            with self._cache_lock:
-                self._cached_status = {
-                    'training_monitoring': {
-                        'success': status_result.get('success', False),
-                        'timestamp': status_result.get('timestamp'),
-                        'total_users': status_result.get('total_users', 0),
-                        'total_notifications_sent': status_result.get('total_notifications_sent', 0),
-                        'error': status_result.get('error')
-                    },
-                    'service_info': {
-                        'running': self.is_running(),
-                        'check_interval_hours': self.check_interval // 3600,
-                        'last_check': status_result.get('timestamp')
-                    }
+            cached_status = {
+                'training_monitoring': {
+                    'success': status_result.get('success', False),
+                    'timestamp': status_result.get('timestamp'),
+                    'total_users': status_result.get('total_users', 0),
+                    'total_notifications_sent': status_result.get('total_notifications_sent', 0),
+                    'error': status_result.get('error')
+                },
+                'service_info': {
+                    'running': self.is_running(),
+                    'check_interval_hours': self.check_interval // 3600,
+                    'last_check': status_result.get('timestamp')
                 }
-                self.last_cache_update = datetime.utcnow()
-                
-                logger.debug(f"Updated training monitoring cache: {status_result.get('total_users', 0)} users, {status_result.get('total_notifications_sent', 0)} notifications")
-                
+            }
+            
+            last_cache_update = datetime.utcnow()
+            self._cached_snapshot = (
+                MappingProxyType(cached_status), last_cache_update.isoformat(), time.monotonic()
+            )
+            self.last_cache_update = last_cache_update
+            
+            logger.debug(
+                "Updated training monitoring cache: %s users, %s notifications",
+                status_result.get('total_users', 0),
+                status_result.get('total_notifications_sent', 0)
+            )
+            
         except Exception as e:
             logger.error(f"Error updating cached status: {e}")
     
-    def get_cached_status(self) -> Optional[Dict[str, Any]]:
-        """Get cached training monitoring status"""
-        try:
-            with self._cache_lock:
-                if self._cached_status is None:
-                    return None
-                
-                cached_data: Dict[str, Any] = self._cached_status.copy()
-                if self.last_cache_update:
-                    cache_age = datetime.utcnow() - self.last_cache_update
-                    cached_data['cache_age_seconds'] = int(cache_age.total_seconds())
-                    cached_data['last_updated'] = self.last_cache_update.isoformat()
-                
-                return cached_data
-                
-        except Exception as e:
-            logger.error(f"Error getting cached status: {e}")
+    def get_cached_status(self) -> Optional[Mapping[str, Any]]:
+        """
+        Get cached training monitoring status
+        
+        Returns:
+            Read-only view over the published snapshot with cache age metadata layered
+            on top, or None if no data available. Use dict() on it before mutating or
+            serializing.
+        """
+        snapshot = self._cached_snapshot
+        if snapshot is None:
             return None
+        
+        cached_status, last_updated, updated_monotonic = snapshot
+        return ChainMap({
+            'cache_age_seconds': int(time.monotonic() - updated_monotonic),
+            'last_updated': last_updated
+        }, cached_status)
     
     def _perform_initial_check(self):
         """
@@ -828,6 +898,11 @@ class TrainingMonitoringService(BaseMonitoringService):
         
         try:
             with self.app.app_context():
+                # Skip the remote scrape entirely when nobody has training monitoring configured
+                if not db.session.query(TrainingSessionSettings.id).limit(1).first():
+                    logger.info("No users configured for training session monitoring; skipping initial scrape")
+                    return
+                
                 # First ensure we have fresh global data
                 global_scrape_result = self.perform_global_training_scrape(force_refresh=True)
                 
@@ -845,22 +920,60 @@ class TrainingMonitoringService(BaseMonitoringService):
     
     def start(self):
         """Start the training monitoring service"""
+        if self._pushover_executor is None:
+            self._pushover_executor = self._create_pushover_executor()
         super().start()
         logger.info("Training monitoring service started successfully (hourly checks)")
     
+    def stop(self):
+        """Stop the training monitoring service and release its Pushover worker threads"""
+        super().stop()
+        executor, self._pushover_executor = self._pushover_executor, None
+        if executor is not None:
+            # Sends already queued still finish and record their log rows
+            executor.shutdown(wait=False)
+    
     def force_check(self):
         """Force an immediate training session check"""
         if not self.is_running():
             logger.warning("Cannot force check - training monitoring service not running")
             return
         
+        if self._force_check_in_flight.is_set():
+            logger.info("Force check already in progress; coalescing")
+            return
+        
+        self._force_check_in_flight.set()
         logger.info("Forcing immediate training session check...")
         try:
             super().force_check()
-            logger.info("Force check completed successfully")
         except Exception as e:
+            self._force_check_in_flight.clear()
             logger.error(f"Error during force check: {e}")
 
 
-# Global training monitoring service instance
-training_monitoring_service = TrainingMonitoringService()
\ No newline at end of file
+# Global training monitoring service instance, created on first use
+_training_monitoring_service: Optional[TrainingMonitoringService] = None
+_training_monitoring_service_lock = threading.Lock()
+
+
+def get_training_monitoring_service() -> TrainingMonitoringService:
+    """
+    Get the global training monitoring service, constructing it on first call
+    
+    Returns:
+        The shared TrainingMonitoringService instance
+    """
+    global _training_monitoring_service
+    if _training_monitoring_service is None:
+        with _training_monitoring_service_lock:
+            if _training_monitoring_service is None:
+                _training_monitoring_service = TrainingMonitoringService()
+    return _training_monitoring_service
+
+
+def __getattr__(name):
+    # Backward compatibility for `from .service import training_monitoring_service`
+    if name == 'training_monitoring_service':
+        return get_training_monitoring_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
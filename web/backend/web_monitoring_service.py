@@ -5,10 +5,15 @@ Monitors all facilities that registered users care about, not just the default O
 """
 
 import logging
+import queue
+import re
 import threading
 import time
+from types import MappingProxyType
+from collections import ChainMap
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional
 
 # Import shared components
 import sys
@@ -21,23 +26,238 @@ from shared.base_monitoring_service import BaseMonitoringService
 from shared.database_interface import DatabaseInterface
 from shared.utils import load_artcc_roster
 
+# Patterns used to derive display callsigns from facility regex patterns
+_PLAIN_CALLSIGN_RE = re.compile(r'^[A-Z0-9_]+$')
+# Anchored literal callsign pattern, which a set lookup can match without running a regex
+_EXACT_CALLSIGN_PATTERN_RE = re.compile(r'^\^([A-Za-z0-9_]+)\$$')
+_SIMPLE_RE = re.compile(r'^([A-Z]{3,4}_[A-Z]{2,4})$')
+_CORE_RE = re.compile(r'([A-Z]{3,4})_.*?([A-Z]{2,4})$')
+_UND_RE = re.compile(r'_+')
+_CALLSIGN_RE = re.compile(r'([A-Z]{3,4})_([A-Z]{2,4})')
+_LETTERS_RE = re.compile(r'([A-Z_]+)')
+
+# Literal facility prefix of a pattern such as "^OAK_(?:[A-Z\d]+_)?TWR$" (the "_" must not be optional)
+_PATTERN_PREFIX_RE = re.compile(r'^\^?([A-Z]{3,4})_(?![?*{])')
+
+
+# Bulk notifications queued within this window are sent as one batch
+_NOTIFICATION_BATCH_WINDOW = 0.25
+_NOTIFICATION_BATCH_MAX = 100
+_NOTIFICATION_QUEUE_SIZE = 256
+
+# Suffixes used to complete a bare facility identifier based on facility type
+_FACILITY_TYPE_SUFFIXES = {
+    'main_facility': '_TWR',
+    'supporting_above': '_APP',
+    'supporting_below': '_GND'
+}
+
+
+@lru_cache(maxsize=4096)
+def _compile_facility_pattern(pattern: str) -> re.Pattern:
+    """Compile a facility regex pattern once (case-insensitive, matching VATSIMCore)"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _compile_facility_union(patterns: tuple) -> Optional[re.Pattern]:
+    """
+    Fuse a set of facility regex patterns into a single case-insensitive alternation
+    
+    Args:
+        patterns: Sorted tuple of regex patterns for one facility type
+        
+    Returns:
+        Compiled alternation, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        return _compile_facility_pattern(patterns[0])
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _split_facility_patterns(patterns: tuple) -> tuple:
+    """
+    Separate anchored literal callsigns (e.g. "^SFO_TWR$") from patterns that need a regex
+    
+    Args:
+        patterns: Sorted tuple of regex patterns for one facility type
+        
+    Returns:
+        Tuple of (frozenset of upper-case exact callsigns, compiled alternation of the rest or None)
+    """
+    exact_callsigns = set()
+    regex_patterns = []
+    for pattern in patterns:
+        exact_match = _EXACT_CALLSIGN_PATTERN_RE.match(pattern)
+        if exact_match:
+            exact_callsigns.add(exact_match.group(1).upper())
+        else:
+            regex_patterns.append(pattern)
+    return frozenset(exact_callsigns), _compile_facility_union(tuple(regex_patterns))
+
+
+@lru_cache(maxsize=1024)
+def _facility_prefixes(patterns: tuple) -> Optional[frozenset]:
+    """
+    Collect the literal callsign prefixes a set of facility patterns can match
+    
+    Args:
+        patterns: Tuple of regex patterns
+        
+    Returns:
+        Frozenset of upper-case prefixes, or None if any pattern has no fixed prefix
+    """
+    prefixes = set()
+    for pattern in patterns:
+        prefix_match = _PATTERN_PREFIX_RE.match(pattern)
+        if prefix_match is None or '|' in pattern:
+            return None
+        prefixes.add(prefix_match.group(1))
+    return frozenset(prefixes)
+
+
+def _build_prefix_index(callsigns: tuple) -> Dict[str, tuple]:
+    """
+    Index controller positions by upper-case callsign prefix (the part before the first '_')
+    
+    Args:
+        callsigns: Controller callsigns in cache order
+        
+    Returns:
+        Dictionary of prefix to ascending tuple of positions in callsigns
+    """
+    index: Dict[str, List[int]] = {}
+    for position, callsign in enumerate(callsigns):
+        index.setdefault(callsign.split('_', 1)[0].upper(), []).append(position)
+    return {prefix: tuple(positions) for prefix, positions in index.items()}
+
+
+@lru_cache(maxsize=2048)
+def _pattern_to_display_name(pattern: str, facility_type: Optional[str]) -> Optional[str]:
+    r"""
+    Derive a user-friendly callsign from a facility regex pattern
+    
+    Args:
+        pattern: The regex pattern to clean (e.g., "^OAK_(?:[A-Z\d]+_)?TWR$")
+        facility_type: Optional facility type used to complete bare identifiers
+        
+    Returns:
+        Cleaned callsign string (e.g., "OAK_TWR") or None if nothing could be extracted
+    """
+    # Check if it's already a simple callsign (no regex special characters)
+    if _PLAIN_CALLSIGN_RE.match(pattern):
+        return pattern
+    
+    # Remove regex anchors
+    clean_pattern = pattern.replace('^', '').replace('$', '')
+    
+    # Handle simple patterns first (like SAN_TWR, SCT_APP, SAN_GND)
+    simple_match = _SIMPLE_RE.search(clean_pattern)
+    if simple_match:
+        return simple_match.group(1)
+    
+    # Handle complex patterns - look for core facility identifiers first
+    # This handles patterns like "OAK_(?:[A-Z\d]+_)?TWR" -> "OAK_TWR"
+    core_match = _CORE_RE.search(clean_pattern)
+    if core_match:
+        return f"{core_match.group(1)}_{core_match.group(2)}"
+    
+    # Apply generic cleaning for more complex cases
+    clean_pattern = clean_pattern.replace('\\d+', '').replace('\\', '').replace('(?:', '').replace(')?', '').replace('_+', '_')
+    clean_pattern = _UND_RE.sub('_', clean_pattern).strip('_')
+    
+    # Look for common callsign patterns like XXX_TWR, XXX_APP, XXX_GND, etc.
+    callsign_match = _CALLSIGN_RE.search(clean_pattern)
+    if callsign_match:
+        return f"{callsign_match.group(1)}_{callsign_match.group(2)}"
+    
+    # Try to find any combination of letters and underscores as fallback
+    letters_match = _LETTERS_RE.search(clean_pattern)
+    if letters_match:
+        name = letters_match.group(1).strip('_')
+        # If it doesn't have an underscore, try to complete it based on facility type
+        if '_' not in name and facility_type:
+            name += _FACILITY_TYPE_SUFFIXES.get(facility_type, '')
+        return name
+    
+    return None
+
+
+class CachedStatus(NamedTuple):
+    """Immutable comprehensive status snapshot published by the monitoring thread"""
+    all_controllers: tuple
+    controller_callsigns: tuple
+    timestamp: str
+    success: bool
+    error: Optional[str]
+    total_controllers: int
+    check_interval: float
+    running: bool
+    last_updated_iso: str
+    last_updated_mono: float
+    epoch: int
+    prefix_index: Mapping[str, tuple] = MappingProxyType({})
+
 
 class WebMonitoringService(BaseMonitoringService):
     """
     Web-specific monitoring service that monitors all facilities users care about
     """
     
+    # User status indexed by (has main controllers << 1) | has supporting above controllers
+    _STATUS_TABLE = (
+        'all_offline',
+        'supporting_above_online',
+        'main_facility_online',
+        'main_facility_and_supporting_above_online'
+    )
+    
     def __init__(self):
         super().__init__()
         
         # Web-specific components
         self.db_interface = DatabaseInterface()
         
-        # Cached status data for UI consumption
-        self._cached_status = None
+        # Reused VATSIMCore clients; the aggregated one is rebuilt only when the aggregated patterns change
+        self._vatsim_core = VATSIMCore(self.config)
+        self._vatsim_core_aggregated: Optional[VATSIMCore] = None
+        self._vatsim_core_aggregated_sig: Optional[tuple] = None
+        
+        # Cached status data for UI consumption, swapped atomically by the monitor thread
+        self._cached_snapshot: Optional[CachedStatus] = None
+        self._cache_epoch = 0
         self._cache_lock = threading.Lock()
         self.last_cache_update = None
         
+        # Filtered controller lists per unique pattern set, valid for a single cache epoch
+        self._filter_cache: Dict[tuple, tuple] = {}
+        self._filter_cache_epoch = 0
+        self._filter_cache_lock = threading.Lock()
+        
+        # Short-lived memo of the aggregated user config (avoids a DB round-trip per call); once the
+        # TTL lapses the config is only rebuilt if the user patterns signature has changed
+        self._agg_config_cache = None
+        self._agg_config_cache_ts = 0.0
+        self._agg_config_ttl = 5.0
+        self._agg_config_sig = None
+        # Facility display names derived from the aggregated config, keyed by the config object they came from
+        self._facility_names_cache: Optional[tuple] = None
+        # The default config never changes at runtime, so its display names are derived once
+        self._default_facility_names = self._get_user_facility_display_names(self.config.get('callsigns', {})) or {
+            'main_facility': 'Main Facility',
+            'supporting_above': 'Supporting Above',
+            'supporting_below': 'Supporting Below'
+        }
+        
+        # Bulk notifications are sent by a worker thread so Pushover latency never blocks monitoring
+        self._notify_queue: queue.Queue = queue.Queue(maxsize=_NOTIFICATION_QUEUE_SIZE)
+        self._notify_thread: Optional[threading.Thread] = None
+        # Set by force_check(); the next successful check sends the manual-check notification
+        self._manual_check_requested = threading.Event()
+        
         logging.info("Web monitoring service initialized")
     
     def check_status(self) -> Dict[str, Any]:
@@ -53,15 +273,66 @@ class WebMonitoringService(BaseMonitoringService):
                 
                 # Send bulk notifications to all users based on their individual configurations
                 # The notification manager will handle filtering for each user's specific patterns
-                self.notification_manager.send_bulk_pushover_notification(
-                    title="VATSIM Network Update",
-                    message=f"VATSIM network status update - {total_controllers} controllers online",
-                    status="network_update"
-                )
-                logging.info(f"Sent bulk notifications for network change - {total_controllers} controllers")
+                if self._manual_check_requested.is_set():
+                    self._manual_check_requested.clear()
+                    self._enqueue_notification(
+                        "Manual Status Check",
+                        "Forced comprehensive status check triggered",
+                        "manual_check",
+                        current_result.get('all_controllers')
+                    )
+                    logging.info(f"Force check completed successfully - collected {total_controllers} controllers")
+                else:
+                    self._enqueue_notification(
+                        "VATSIM Network Update",
+                        f"VATSIM network status update - {total_controllers} controllers online",
+                        "network_update",
+                        current_result.get('all_controllers')
+                    )
+                    logging.info(f"Queued bulk notifications for network change - {total_controllers} controllers")
             except Exception as e:
                 logging.error(f"Error sending bulk notifications: {e}")
 
+    def _enqueue_notification(self, title: str, message: str, status: str,
+                              all_controllers: Optional[List[Dict[str, Any]]] = None):
+        """
+        Queue a bulk notification for the notification worker
+        
+        Args:
+            title: Notification title
+            message: Notification message
+            status: Status used to pick priority and sound
+            all_controllers: Controllers from the triggering check, reused instead of refetching per user
+        """
+        try:
+            self._notify_queue.put_nowait((title, message, status, all_controllers))
+        except queue.Full:
+            # Queued entries collapse into one personalized pass, so dropping loses nothing
+            logging.warning("Notification queue full - dropping bulk notification")
+    
+    def _notify_worker(self):
+        """Drain the notification queue, sending entries that arrive within a short window as one batch"""
+        while True:
+            notifications = [self._notify_queue.get()]
+            deadline = time.monotonic() + _NOTIFICATION_BATCH_WINDOW
+            
+            while len(notifications) < _NOTIFICATION_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    notifications.append(self._notify_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            if not self.notification_manager:
+                continue
+            
+            try:
+                self.notification_manager.send_bulk_pushover_notification_batch(notifications)
+            except Exception as e:
+                logging.error(f"Error sending batched bulk notifications: {e}")
+    
     def on_status_updated(self, current_result: Dict[str, Any]):
         """Update cache on every status check (overrides base method)"""
         self.update_cached_status(current_result)
@@ -98,9 +369,46 @@ class WebMonitoringService(BaseMonitoringService):
                 'supporting_below': []
             }
     
-    def get_aggregated_config(self) -> Optional[Dict[str, Any]]:
+    def get_aggregated_config(self) -> Optional[Mapping[str, Any]]:
         """
         Get configuration with aggregated facility patterns from all users
+        Results are memoized for a short TTL; call invalidate_aggregated_config() after pattern writes
+        
+        Returns:
+            Config dictionary with aggregated patterns or None if no users found
+        """
+        with self._cache_lock:
+            if time.monotonic() - self._agg_config_cache_ts < self._agg_config_ttl:
+                return self._agg_config_cache
+            cached_sig = self._agg_config_sig
+        
+        patterns_sig = self.db_interface.get_user_patterns_version()
+        if patterns_sig is not None and patterns_sig == cached_sig:
+            # User patterns unchanged - extend the cached config instead of rebuilding it
+            with self._cache_lock:
+                if self._agg_config_sig == patterns_sig:
+                    self._agg_config_cache_ts = time.monotonic()
+                    return self._agg_config_cache
+        
+        aggregated_config = self._build_aggregated_config()
+        
+        with self._cache_lock:
+            self._agg_config_cache = aggregated_config
+            self._agg_config_cache_ts = time.monotonic()
+            self._agg_config_sig = patterns_sig
+        
+        return aggregated_config
+    
+    def invalidate_aggregated_config(self):
+        """Drop the memoized aggregated config so the next call reloads user patterns"""
+        with self._cache_lock:
+            self._agg_config_cache = None
+            self._agg_config_cache_ts = 0.0
+            self._agg_config_sig = None
+    
+    def _build_aggregated_config(self) -> Optional[Mapping[str, Any]]:
+        """
+        Build configuration with aggregated facility patterns from the database
         
         Returns:
             Config dictionary with aggregated patterns or None if no users found
@@ -114,19 +422,16 @@ class WebMonitoringService(BaseMonitoringService):
             aggregated_patterns = self.db_interface.get_all_user_facility_patterns()
             
             # If no custom patterns found, return None to use default config
-            total_patterns = sum(len(patterns) for patterns in aggregated_patterns.values())
+            total_patterns = sum([len(patterns) for patterns in aggregated_patterns.values()])
             if total_patterns == 0:
                 logging.info("No custom user facility patterns found - using default config")
                 return None
             
-            # Create config with aggregated patterns
-            aggregated_config = self.config.copy()
-            
+            # Overlay aggregated patterns on the base config without copying it
             # Use aggregated user patterns directly - no merging with defaults
             # Default patterns are already included by get_all_user_facility_patterns() if no user patterns exist
-            aggregated_config['callsigns'] = aggregated_patterns
+            aggregated_config = ChainMap({'callsigns': aggregated_patterns}, self.config)
             
-            total_patterns = sum(len(patterns) for patterns in aggregated_patterns.values())
             logging.info(f"Using aggregated config with {total_patterns} facility patterns (user patterns only)")
             
             return aggregated_config
@@ -146,64 +451,14 @@ class WebMonitoringService(BaseMonitoringService):
         Returns:
             Cleaned callsign string (e.g., "OAK_TWR")
         """
-        import re
-        
         try:
-            # Check if it's already a simple callsign (no regex special characters)
-            if re.match(r'^[A-Z0-9_]+$', pattern) and not any(char in pattern for char in ['^', '$', '\\', '(', ')', '?', '+', '*', '[', ']', '{', '}']):
-                logging.debug(f"Pattern is already a plain callsign: {pattern}")
-                return pattern
-            
-            # Remove regex anchors
-            clean_pattern = pattern.replace('^', '').replace('$', '')
-            
-            # Handle simple patterns first (like SAN_TWR, SCT_APP, SAN_GND)
-            simple_match = re.search(r'^([A-Z]{3,4}_[A-Z]{2,4})$', clean_pattern)
-            if simple_match:
-                result = simple_match.group(1)
-                logging.debug(f"Extracted simple callsign: {result} from pattern: {pattern}")
-                return result
-            
-            # Handle complex patterns - look for core facility identifiers first
-            # This handles patterns like "OAK_(?:[A-Z\d]+_)?TWR" -> "OAK_TWR"
-            core_match = re.search(r'([A-Z]{3,4})_.*?([A-Z]{2,4})$', clean_pattern)
-            if core_match:
-                result = f"{core_match.group(1)}_{core_match.group(2)}"
-                logging.debug(f"Extracted core callsign: {result} from pattern: {pattern}")
-                return result
-            
-            # Apply generic cleaning for more complex cases
-            clean_pattern = clean_pattern.replace('\\d+', '').replace('\\', '').replace('(?:', '').replace(')?', '').replace('_+', '_')
-            clean_pattern = re.sub(r'_+', '_', clean_pattern).strip('_')
-            
-            # Look for common callsign patterns
-            callsign_match = re.search(r'([A-Z]{3,4})_([A-Z]{2,4})', clean_pattern)
-            if callsign_match:
-                result = f"{callsign_match.group(1)}_{callsign_match.group(2)}"
-                logging.debug(f"Extracted callsign after cleaning: {result} from pattern: {pattern}")
-                return result
-            
-            # Try to find any combination of letters and underscores as fallback
-            letters_match = re.search(r'([A-Z_]+)', clean_pattern)
-            if letters_match:
-                name = letters_match.group(1).strip('_')
-                # If it doesn't have an underscore, try to complete it based on facility type
-                if '_' not in name and facility_type:
-                    suffix_map = {
-                        'main_facility': '_TWR',
-                        'supporting_above': '_APP',
-                        'supporting_below': '_GND'
-                    }
-                    name += suffix_map.get(facility_type, '')
-                
-                logging.debug(f"Extracted fallback callsign: {name} from pattern: {pattern}")
-                return name
+            display_name = _pattern_to_display_name(pattern, facility_type)
+            if display_name is not None:
+                return display_name
             
             # Final fallback - return a generic name based on facility type
             if facility_type:
-                fallback = f"{facility_type.replace('_', ' ').title()}"
-                logging.debug(f"Using fallback name: {fallback} for pattern: {pattern}")
-                return fallback
+                return facility_type.replace('_', ' ').title()
             
             logging.warning(f"Could not extract callsign from pattern: {pattern}")
             return "Unknown Facility"
@@ -222,6 +477,12 @@ class WebMonitoringService(BaseMonitoringService):
         try:
             # Get the effective config (aggregated if available, otherwise default)
             config = self.get_aggregated_config() or self.config
+            
+            # The memoized config object is reused until its patterns change, so its identity is the cache key
+            names_cache = self._facility_names_cache
+            if names_cache is not None and names_cache[0] is config:
+                return dict(names_cache[1])
+            
             callsigns = config.get('callsigns', {})
             
             facility_names = {}
@@ -237,7 +498,8 @@ class WebMonitoringService(BaseMonitoringService):
                     facility_names[facility_type] = f"{facility_type.replace('_', ' ').title()}"
                     
             logging.debug(f"Extracted facility names: {facility_names}")
-            return facility_names
+            self._facility_names_cache = (config, facility_names)
+            return dict(facility_names)
             
         except Exception as e:
             logging.error(f"Error extracting facility names: {e}")
@@ -256,11 +518,8 @@ class WebMonitoringService(BaseMonitoringService):
             Comprehensive status result dictionary with all controllers
         """
         try:
-            # Create VATSIMCore with default config (patterns don't matter for comprehensive collection)
-            vatsim_core = VATSIMCore(self.config)
-            
-            # Get comprehensive controller data
-            result = vatsim_core.check_status_comprehensive()
+            # Default config client (patterns don't matter for comprehensive collection)
+            result = self._vatsim_core.check_status_comprehensive()
             
             if result['success']:
                 logging.debug(f"Comprehensive status check successful: {result['total_controllers']} controllers collected")
@@ -292,12 +551,29 @@ class WebMonitoringService(BaseMonitoringService):
             aggregated_config = self.get_aggregated_config()
             
             if aggregated_config:
-                # Create VATSIMCore with aggregated patterns
-                vatsim_core = VATSIMCore(aggregated_config)
+                # Reuse the aggregated client while the aggregated patterns are unchanged
+                callsigns = aggregated_config.get('callsigns', {})
+                core_sig = tuple((facility_type, tuple(patterns)) for facility_type, patterns in sorted(callsigns.items()))
+                if self._vatsim_core_aggregated is None or self._vatsim_core_aggregated_sig != core_sig:
+                    self._vatsim_core_aggregated = VATSIMCore.from_callsigns(callsigns, self.config.get('api'))
+                    self._vatsim_core_aggregated_sig = core_sig
+                    
+                    # Swap in one fused matcher per facility type, compiled once per pattern change
+                    try:
+                        fused = [
+                            _compile_facility_union(tuple(sorted(callsigns.get(facility_type, []))))
+                            for facility_type in ('main_facility', 'supporting_above', 'supporting_below')
+                        ]
+                        self._vatsim_core_aggregated.set_compiled_patterns(
+                            *[[union] if union is not None else [] for union in fused]
+                        )
+                    except re.error as e:
+                        logging.debug(f"Keeping per-pattern matchers for aggregated config: {e}")
+                vatsim_core = self._vatsim_core_aggregated
                 logging.debug("Using aggregated facility patterns for monitoring")
             else:
                 # Fall back to default config
-                vatsim_core = VATSIMCore(self.config)
+                vatsim_core = self._vatsim_core
                 logging.debug("Using default facility patterns for monitoring")
             
             # Check current status
@@ -332,30 +608,63 @@ class WebMonitoringService(BaseMonitoringService):
             status_result: Latest comprehensive status check result
         """
         try:
-            with self._cache_lock:
-                self._cached_status = {
-                    # Store comprehensive controller data
-                    'all_controllers': status_result.get('all_controllers', []),
-                    'timestamp': status_result.get('timestamp', datetime.now().isoformat()),
-                    'success': status_result.get('success', False),
-                    'error': status_result.get('error'),
-                    'total_controllers': status_result.get('total_controllers', 0),
-                    'config': {
-                        'check_interval': self.check_interval
-                    },
-                    'monitoring_service': {
-                        'using_comprehensive_cache': True,
-                        'running': self.is_running()
-                    }
-                }
-                self.last_cache_update = datetime.now()
-                
-                total_controllers = status_result.get('total_controllers', 0)
-                logging.debug(f"Updated comprehensive cached status: {total_controllers} controllers")
+            all_controllers = tuple(status_result.get('all_controllers', []))
+            previous = self._cached_snapshot
+            # An unchanged VATSIM feed hands back the same controller objects, so the
+            # element-wise comparison short-circuits on identity instead of comparing dicts
+            if (previous is not None and previous.success and status_result.get('success')
+                    and previous.all_controllers == all_controllers):
+                # Nothing changed since the last tick; keep the epoch so filter caches stay valid
+                self._touch_cached_status(previous, status_result)
+                return
+            
+            last_cache_update = datetime.now()
+            last_cache_update_iso = last_cache_update.isoformat()
+            self._cache_epoch += 1
+            controller_callsigns = tuple(c.get('callsign', '') for c in all_controllers)
+            
+            # Publish the immutable record with a single assignment so readers need no lock
+            self._cached_snapshot = CachedStatus(
+                all_controllers=all_controllers,
+                controller_callsigns=controller_callsigns,
+                timestamp=status_result.get('timestamp') or last_cache_update_iso,
+                success=status_result.get('success', False),
+                error=status_result.get('error'),
+                total_controllers=status_result.get('total_controllers', 0),
+                check_interval=self.check_interval,
+                running=self.is_running(),
+                last_updated_iso=last_cache_update_iso,
+                last_updated_mono=time.monotonic(),
+                epoch=self._cache_epoch,
+                prefix_index=MappingProxyType(_build_prefix_index(controller_callsigns))
+            )
+            self.last_cache_update = last_cache_update
+            
+            logging.debug(f"Updated comprehensive cached status: {len(all_controllers)} controllers")
                 
         except Exception as e:
             logging.error(f"Error updating cached status: {e}")
     
+    def _touch_cached_status(self, previous: CachedStatus, status_result: Dict[str, Any]):
+        """
+        Refresh only the freshness fields of an unchanged cached snapshot
+        
+        Args:
+            previous: Currently published snapshot
+            status_result: Latest comprehensive status check result
+        """
+        last_cache_update = datetime.now()
+        last_cache_update_iso = last_cache_update.isoformat()
+        self._cached_snapshot = previous._replace(
+            timestamp=status_result.get('timestamp') or last_cache_update_iso,
+            check_interval=self.check_interval,
+            running=self.is_running(),
+            last_updated_iso=last_cache_update_iso,
+            last_updated_mono=time.monotonic()
+        )
+        self.last_cache_update = last_cache_update
+        logging.debug("Controller data unchanged - refreshed cache timestamp only")
+    
     def get_cached_status(self) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive cached controller data
@@ -363,23 +672,26 @@ class WebMonitoringService(BaseMonitoringService):
         Returns:
             Cached comprehensive controller data or None if no data available
         """
-        try:
-            with self._cache_lock:
-                if self._cached_status is None:
-                    return None
-                
-                # Add cache age information
-                cached_data = self._cached_status.copy()
-                if self.last_cache_update:
-                    cache_age = datetime.now() - self.last_cache_update
-                    cached_data['cache_age_seconds'] = int(cache_age.total_seconds())
-                    cached_data['last_updated'] = self.last_cache_update.isoformat()
-                
-                return cached_data
-                
-        except Exception as e:
-            logging.error(f"Error getting cached status: {e}")
+        cached_status = self._cached_snapshot
+        if cached_status is None:
             return None
+        
+        return {
+            'all_controllers': cached_status.all_controllers,
+            'timestamp': cached_status.timestamp,
+            'success': cached_status.success,
+            'error': cached_status.error,
+            'total_controllers': cached_status.total_controllers,
+            'config': {
+                'check_interval': cached_status.check_interval
+            },
+            'monitoring_service': {
+                'using_comprehensive_cache': True,
+                'running': cached_status.running
+            },
+            'cache_age_seconds': int(time.monotonic() - cached_status.last_updated_mono),
+            'last_updated': cached_status.last_updated_iso
+        }
     
     def get_user_filtered_status(self, user_facility_patterns: Dict[str, List[str]]) -> Optional[Dict[str, Any]]:
         """
@@ -394,30 +706,40 @@ class WebMonitoringService(BaseMonitoringService):
         """
         try:
             # Get comprehensive cached controller data
-            cached_data = self.get_cached_status()
-            if cached_data is None:
+            cached_status = self._cached_snapshot
+            if cached_status is None:
                 return None
             
-            # Get all active controllers from cache
-            all_controllers = cached_data.get('all_controllers', [])
+            # Get all active controllers and response metadata from cache once
+            all_controllers = cached_status.all_controllers
+            controller_callsigns = cached_status.controller_callsigns
+            prefix_index = cached_status.prefix_index
+            cache_epoch = cached_status.epoch
+            timestamp = cached_status.timestamp
+            cache_age_seconds = int(time.monotonic() - cached_status.last_updated_mono)
+            last_updated = cached_status.last_updated_iso
+            success = cached_status.success
+            total_controllers = cached_status.total_controllers
+            config = {'check_interval': cached_status.check_interval}
+            monitoring_service = {'using_comprehensive_cache': True, 'running': cached_status.running}
             
             # If no user patterns provided, use default config patterns to filter the data
-            if not user_facility_patterns or not any(user_facility_patterns.values()):
+            has_user_patterns = bool(user_facility_patterns) and bool(
+                user_facility_patterns.get('main_facility')
+                or user_facility_patterns.get('supporting_above')
+                or user_facility_patterns.get('supporting_below')
+            )
+            if not has_user_patterns:
                 # Use default config patterns instead of returning empty lists
                 default_config_patterns = self.config.get('callsigns', {})
-                default_facility_names = self._get_user_facility_display_names(default_config_patterns)
                 
                 logging.debug(f"No user patterns provided, using default config patterns: {default_config_patterns}")
                 
                 # Filter using default patterns
-                vatsim_core = VATSIMCore(self.config)
-                filtered_main, filtered_above, filtered_below = vatsim_core.filter_comprehensive_data(
-                    all_controllers, default_config_patterns
+                filtered_main, filtered_above, filtered_below, default_status = self._get_filtered_controllers(
+                    cache_epoch, all_controllers, default_config_patterns, controller_callsigns, prefix_index
                 )
                 
-                # Determine status based on filtered results
-                default_status = self._determine_user_status(filtered_main, filtered_above, filtered_below)
-                
                 # Return filtered data using default config patterns
                 return {
                     'status': default_status,
@@ -426,38 +748,28 @@ class WebMonitoringService(BaseMonitoringService):
                     'supporting_above': filtered_above,
                     'supporting_below': filtered_below,
                     'using_user_config': False,
-                    'facility_names': default_facility_names or {
-                        'main_facility': 'Main Facility',
-                        'supporting_above': 'Supporting Above',
-                        'supporting_below': 'Supporting Below'
-                    },
+                    'facility_names': dict(self._default_facility_names),
                     'filtered_counts': {
                         'main': len(filtered_main),
                         'supporting_above': len(filtered_above),
                         'supporting_below': len(filtered_below)
                     },
-                    'timestamp': cached_data.get('timestamp'),
-                    'cache_age_seconds': cached_data.get('cache_age_seconds'),
-                    'last_updated': cached_data.get('last_updated'),
-                    'success': cached_data.get('success'),
-                    'total_controllers': cached_data.get('total_controllers', 0),
-                    'config': cached_data.get('config', {}),
-                    'monitoring_service': cached_data.get('monitoring_service', {})
+                    'timestamp': timestamp,
+                    'cache_age_seconds': cache_age_seconds,
+                    'last_updated': last_updated,
+                    'success': success,
+                    'total_controllers': total_controllers,
+                    'config': config,
+                    'monitoring_service': monitoring_service
                 }
             
             logging.debug(f"Filtering {len(all_controllers)} controllers with user patterns: {user_facility_patterns}")
             
-            # Create VATSIMCore instance for filtering (config doesn't matter for filtering)
-            vatsim_core = VATSIMCore(self.config)
-            
-            # Filter controllers using VATSIMCore filtering methods
-            filtered_main, filtered_above, filtered_below = vatsim_core.filter_comprehensive_data(
-                all_controllers, user_facility_patterns
+            # Filter controllers (shared across users with the same pattern set)
+            filtered_main, filtered_above, filtered_below, user_status = self._get_filtered_controllers(
+                cache_epoch, all_controllers, user_facility_patterns, controller_callsigns, prefix_index
             )
             
-            # Determine user-specific status
-            user_status = self._determine_user_status(filtered_main, filtered_above, filtered_below)
-            
             # Create user-specific facility names for display
             user_facility_names = self._get_user_facility_display_names(user_facility_patterns)
             
@@ -470,18 +782,18 @@ class WebMonitoringService(BaseMonitoringService):
                 'supporting_below': filtered_below,
                 'using_user_config': True,
                 'facility_names': user_facility_names,
-                'timestamp': cached_data.get('timestamp'),
-                'cache_age_seconds': cached_data.get('cache_age_seconds'),
-                'last_updated': cached_data.get('last_updated'),
-                'success': cached_data.get('success'),
-                'total_controllers': cached_data.get('total_controllers', 0),
+                'timestamp': timestamp,
+                'cache_age_seconds': cache_age_seconds,
+                'last_updated': last_updated,
+                'success': success,
+                'total_controllers': total_controllers,
                 'filtered_counts': {
                     'main': len(filtered_main),
                     'supporting_above': len(filtered_above),
                     'supporting_below': len(filtered_below)
                 },
-                'config': cached_data.get('config', {}),
-                'monitoring_service': cached_data.get('monitoring_service', {})
+                'config': config,
+                'monitoring_service': monitoring_service
             }
             
             logging.debug(f"User filtered status: {user_status} ({len(filtered_main)}/{len(filtered_above)}/{len(filtered_below)} controllers)")
@@ -492,6 +804,89 @@ class WebMonitoringService(BaseMonitoringService):
             return None
     
     
+    def _get_filtered_controllers(self, cache_epoch: int, all_controllers: List[Dict[str, Any]],
+                                  facility_patterns: Dict[str, List[str]],
+                                  controller_callsigns: Optional[tuple] = None,
+                                  prefix_index: Optional[Mapping[str, tuple]] = None) -> tuple:
+        """
+        Filter cached controllers by facility patterns, memoized per pattern set and cache epoch
+        
+        Args:
+            cache_epoch: Epoch of the snapshot all_controllers was taken from
+            all_controllers: All active controllers from the comprehensive cache
+            facility_patterns: Dictionary of facility type to regex patterns
+            controller_callsigns: Callsigns parallel to all_controllers, if precomputed
+            prefix_index: Positions in all_controllers by callsign prefix, if precomputed
+        
+        Returns:
+            Tuple of (main_controllers, supporting_above, supporting_below, status); the lists
+            are shared between callers and must not be mutated
+        """
+        # Filter output follows controller order, so pattern order and repeats don't affect the result
+        main_key = tuple(sorted(set(facility_patterns.get('main_facility', []))))
+        above_key = tuple(sorted(set(facility_patterns.get('supporting_above', []))))
+        below_key = tuple(sorted(set(facility_patterns.get('supporting_below', []))))
+        key = (main_key, above_key, below_key)
+        
+        with self._filter_cache_lock:
+            if self._filter_cache_epoch != cache_epoch:
+                # New comprehensive data - drop results from older epochs
+                self._filter_cache = {}
+                self._filter_cache_epoch = cache_epoch
+            cached = self._filter_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Skip controllers whose callsign prefix no pattern can match before running any regex
+        prefixes = _facility_prefixes(main_key + above_key + below_key)
+        if prefixes is not None:
+            if controller_callsigns is None:
+                controller_callsigns = tuple(c.get('callsign', '') for c in all_controllers)
+            if prefix_index is None:
+                prefix_index = _build_prefix_index(controller_callsigns)
+            # Look candidates up through the snapshot's index instead of scanning every controller
+            positions = sorted(
+                position for prefix in prefixes for position in prefix_index.get(prefix, ())
+            )
+            controller_callsigns = [controller_callsigns[position] for position in positions]
+            all_controllers = [all_controllers[position] for position in positions]
+        
+        try:
+            main_exact, main_union = _split_facility_patterns(main_key)
+            above_exact, above_union = _split_facility_patterns(above_key)
+            below_exact, below_union = _split_facility_patterns(below_key)
+            filtered_main, filtered_above, filtered_below = self._vatsim_core.filter_comprehensive_data_union(
+                all_controllers,
+                main_union,
+                above_union,
+                below_union,
+                controller_callsigns,
+                (main_exact, above_exact, below_exact)
+            )
+        except re.error as e:
+            # Some patterns can't be fused (e.g. mid-pattern global flags); match them individually
+            logging.debug(f"Falling back to per-pattern filtering: {e}")
+            compiled_patterns = {
+                'main_facility': [_compile_facility_pattern(pattern) for pattern in main_key],
+                'supporting_above': [_compile_facility_pattern(pattern) for pattern in above_key],
+                'supporting_below': [_compile_facility_pattern(pattern) for pattern in below_key]
+            }
+            filtered_main, filtered_above, filtered_below = self._vatsim_core.filter_comprehensive_data_compiled(
+                all_controllers, compiled_patterns, controller_callsigns
+            )
+        result = (
+            filtered_main,
+            filtered_above,
+            filtered_below,
+            self._determine_user_status(filtered_main, filtered_above, filtered_below)
+        )
+        
+        with self._filter_cache_lock:
+            if self._filter_cache_epoch == cache_epoch:
+                self._filter_cache[key] = result
+        
+        return result
+    
     def _determine_user_status(self, main_controllers: List, supporting_above: List, supporting_below: List) -> str:
         """
         Determine status based on filtered controller lists
@@ -504,14 +899,7 @@ class WebMonitoringService(BaseMonitoringService):
         Returns:
             Status string
         """
-        if main_controllers and supporting_above:
-            return 'main_facility_and_supporting_above_online'
-        elif main_controllers:
-            return 'main_facility_online'
-        elif supporting_above:
-            return 'supporting_above_online'
-        else:
-            return 'all_offline'
+        return self._STATUS_TABLE[(bool(main_controllers) << 1) | bool(supporting_above)]
     
     def _get_user_facility_display_names(self, user_patterns: Dict[str, List[str]]) -> Dict[str, str]:
         """
@@ -523,7 +911,6 @@ class WebMonitoringService(BaseMonitoringService):
         Returns:
             Dictionary with display names for each facility type
         """
-        import re
         facility_names = {}
         
         for facility_type, patterns in user_patterns.items():
@@ -532,52 +919,9 @@ class WebMonitoringService(BaseMonitoringService):
                 
             # Use the first pattern to derive a display name
             pattern = patterns[0]
-            display_name = None
             
             # Try to extract a clean callsign from the regex pattern
-            if re.match(r'^[A-Z0-9_]+$', pattern) and not any(char in pattern for char in ['^', '$', '\\', '(', ')', '?', '+', '*', '[', ']', '{', '}']):
-                # It's already a plain callsign
-                display_name = pattern
-            else:
-                # Remove regex anchors and escape characters, but preserve the core callsign
-                clean_pattern = pattern.replace('^', '').replace('$', '')
-                
-                # Handle simple patterns first (like ^SAN_TWR$, ^SCT_APP$, ^SAN_GND$)
-                simple_match = re.search(r'^([A-Z]{3,4}_[A-Z]{2,4})$', clean_pattern)
-                if simple_match:
-                    display_name = simple_match.group(1)
-                else:
-                    # Handle more complex patterns - look for core facility identifiers first
-                    # Try to extract the base pattern by looking for fixed parts
-                    core_match = re.search(r'([A-Z]{3,4})_.*?([A-Z]{2,4})$', clean_pattern)
-                    if core_match:
-                        display_name = f"{core_match.group(1)}_{core_match.group(2)}"
-                    else:
-                        # Apply more generic cleaning logic as fallback
-                        clean_pattern = clean_pattern.replace('\\d+', '').replace('\\', '').replace('(?:', '').replace(')?', '').replace('_+', '_')
-                        # Clean up consecutive underscores and trim
-                        clean_pattern = re.sub(r'_+', '_', clean_pattern).strip('_')
-                        
-                        # Look for common callsign patterns like XXX_TWR, XXX_APP, XXX_GND, etc.
-                        callsign_match = re.search(r'([A-Z]{3,4})_([A-Z]{2,4})', clean_pattern)
-                        if callsign_match:
-                            display_name = f"{callsign_match.group(1)}_{callsign_match.group(2)}"
-                        else:
-                            # Try to find any combination of letters and underscores
-                            letters_match = re.search(r'([A-Z_]+)', clean_pattern)
-                            if letters_match:
-                                # Clean up the matched pattern
-                                name = letters_match.group(1).strip('_')
-                                # If it doesn't have an underscore, it's probably incomplete
-                                if '_' not in name:
-                                    # Try common facility type mappings based on context
-                                    if facility_type == 'main_facility':
-                                        name += '_TWR'
-                                    elif facility_type == 'supporting_above':
-                                        name += '_APP'
-                                    elif facility_type == 'supporting_below':
-                                        name += '_GND'
-                                display_name = name
+            display_name = _pattern_to_display_name(pattern, facility_type)
             
             # If we have multiple patterns, show count
             if len(patterns) > 1:
@@ -596,6 +940,13 @@ class WebMonitoringService(BaseMonitoringService):
         if not self.db_interface.enabled:
             logging.warning("Database interface not available - bulk notifications will be disabled")
         
+        # The worker outlives stop()/start() cycles so queued notifications are never stranded
+        if self._notify_thread is None or not self._notify_thread.is_alive():
+            self._notify_thread = threading.Thread(
+                target=self._notify_worker, name="WebMonitoringService:notify", daemon=True
+            )
+            self._notify_thread.start()
+        
         super().start()
         logging.info("Web monitoring service started successfully (comprehensive data collection mode)")
     
@@ -605,29 +956,35 @@ class WebMonitoringService(BaseMonitoringService):
             logging.warning("Cannot force check - monitoring service not running")
             return
         
+        # The monitoring loop wakes up, runs the comprehensive check and queues the manual-check
+        # bulk notification, so a forced check never races the loop with a second VATSIM fetch
         logging.info("Forcing immediate comprehensive status check...")
-        try:
-            # Use base class force check mechanism
-            super().force_check()
-            
-            # Additional web-specific force check handling
-            current_result = self.check_status_comprehensive()
-            
-            if current_result.get('success') and self.notification_manager:
-                # Trigger bulk notifications on force check
-                # Note: Notifications still use individual user patterns, but monitoring collects comprehensive data
-                self.notification_manager.send_bulk_pushover_notification(
-                    title="Manual Status Check",
-                    message="Forced comprehensive status check triggered",
-                    status="manual_check"
-                )
-                logging.info(f"Force check completed successfully - collected {current_result.get('total_controllers', 0)} controllers")
-            else:
-                logging.warning(f"Force check failed: {current_result.get('error', 'Unknown error')}")
-                
-        except Exception as e:
-            logging.error(f"Error during force check: {e}")
+        self._manual_check_requested.set()
+        super().force_check()
+
+
+# Global web monitoring service instance, created on first use
+_web_monitoring_service: Optional[WebMonitoringService] = None
+_web_monitoring_service_lock = threading.Lock()
+
+
+def get_web_monitoring_service() -> WebMonitoringService:
+    """
+    Get the global web monitoring service, constructing it on first call
+    
+    Returns:
+        The shared WebMonitoringService instance
+    """
+    global _web_monitoring_service
+    if _web_monitoring_service is None:
+        with _web_monitoring_service_lock:
+            if _web_monitoring_service is None:
+                _web_monitoring_service = WebMonitoringService()
+    return _web_monitoring_service
 
 
-# Global web monitoring service instance
-web_monitoring_service = WebMonitoringService()
\ No newline at end of file
+def __getattr__(name):
+    # Backward compatibility for `from web_monitoring_service import web_monitoring_service`
+    if name == 'web_monitoring_service':
+        return get_web_monitoring_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
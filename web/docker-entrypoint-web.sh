@@ -33,6 +33,8 @@ log "Migrations are handled by init container - skipping here"
 export GUNICORN_WORKERS=${GUNICORN_WORKERS:-1}
 export GUNICORN_BIND=${GUNICORN_BIND:-0.0.0.0:8080}
 export GUNICORN_TIMEOUT=${GUNICORN_TIMEOUT:-120}
+export GUNICORN_THREADS=${GUNICORN_THREADS:-8}
+export GUNICORN_KEEPALIVE=${GUNICORN_KEEPALIVE:-5}
 
 log "Configuration complete. Starting application as 'vatsim' user..."
 
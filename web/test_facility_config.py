@@ -12,6 +12,15 @@ from datetime import datetime
 # Setup path to include the web backend
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def get_test_app():
+    """Return the application instance shared by all tests
+    
+    backend.app builds its app at import time; reusing it avoids another engine,
+    another create_all() pass and another set of monitoring start-up timers per test.
+    """
+    from backend.app import app
+    return app
+
 def test_imports():
     """Test that all required modules can be imported"""
     print("🧪 Testing module imports...")
@@ -34,15 +43,11 @@ def test_database_models():
     print("\n🧪 Testing database models...")
     
     try:
-        from backend.app import create_app
         from backend.models import db, User, UserSettings
         from backend.facility_monitor.models import UserFacilityRegex
         
-        app = create_app()
+        app = get_test_app()
         with app.app_context():
-            # Create tables if they don't exist
-            db.create_all()
-            
             # Test creating a user
             test_user = User()
             test_user.email = "test@example.com"
@@ -70,13 +75,18 @@ def test_database_models():
                 ("supporting_below", "^TEST_GND$", 0)
             ]
             
-            for facility_type, pattern, sort_order in test_patterns:
-                regex_entry = UserFacilityRegex()
-                regex_entry.user_settings_id = test_settings.id
-                regex_entry.facility_type = facility_type
-                regex_entry.regex_pattern = pattern
-                regex_entry.sort_order = sort_order
-                db.session.add(regex_entry)
+            db.session.execute(
+                UserFacilityRegex.__table__.insert(),
+                [
+                    {
+                        "user_settings_id": test_settings.id,
+                        "facility_type": facility_type,
+                        "regex_pattern": pattern,
+                        "sort_order": sort_order
+                    }
+                    for facility_type, pattern, sort_order in test_patterns
+                ]
+            )
             
             db.session.commit()
             
@@ -201,11 +211,10 @@ def test_integration():
     print("\n🧪 Testing integration workflow...")
     
     try:
-        from backend.app import create_app
         from backend.models import db, User, UserSettings
         from backend.facility_monitor.service import FacilityStatusService
         
-        app = create_app()
+        app = get_test_app()
         with app.app_context():
             # Create a test user with custom patterns
             test_user = User()